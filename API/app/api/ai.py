@@ -1,8 +1,10 @@
 """
 AI Chat API endpoints
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator
+import orjson
 from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import StreamingResponse, ORJSONResponse
 from pydantic import BaseModel, Field
 
 from app.services.ai.ai_service import ai_service
@@ -89,6 +91,59 @@ async def chat(request: ChatRequest):
         )
 
 
+_SSE_DONE = b'data: {"done":true}\n\n'
+
+
+def _sse_event(data: Dict[str, Any]) -> bytes:
+    """Encode one Server-Sent Event carrying a JSON object"""
+    return b"data: " + orjson.dumps(data) + b"\n\n"
+
+
+async def _sse_events(chunks: AsyncIterator[str]) -> AsyncIterator[bytes]:
+    """Wrap provider text chunks as Server-Sent Events"""
+    try:
+        async for chunk in chunks:
+            yield _sse_event({"delta": chunk})
+    except Exception as e:
+        # Headers are already sent - report the failure in-band
+        yield _sse_event({"error": f"AI chat error: {str(e)}"})
+        return
+    yield _SSE_DONE
+
+
+@router.post("/chat/stream")
+async def chat_stream(request: ChatRequest):
+    """
+    Stream the AI Copilot response as Server-Sent Events.
+    
+    Same request body as `/chat`. Each event carries a `delta` with the next
+    chunk of text; the stream ends with `{"done":true}` (or `{"error":...}`).
+    
+    **Example Event:**
+    ```
+    data: {"delta":"This replacement "}
+    ```
+    """
+    try:
+        chunks = ai_service.stream_chat(
+            user_message=request.message,
+            context=request.context,
+            conversation_history=request.conversation_history,
+            temperature=request.temperature
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"AI chat error: {str(e)}"
+        )
+    
+    return StreamingResponse(
+        _sse_events(chunks),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get("/quick-actions/{alert_type}", response_model=QuickActionsResponse)
 async def get_quick_actions(alert_type: str):
     """
@@ -102,12 +157,11 @@ async def get_quick_actions(alert_type: str):
     - INCOME_ACTIVATION
     - SUITABILITY_DRIFT
     """
-    actions = ai_service.get_quick_actions(alert_type)
-    
-    return QuickActionsResponse(
-        alert_type=alert_type,
-        actions=actions
-    )
+    # Plain dict straight to orjson - the actions are static, nothing to validate
+    return ORJSONResponse({
+        "alert_type": alert_type,
+        "actions": ai_service.get_quick_actions(alert_type)
+    })
 
 
 @router.get("/provider-info")
@@ -2,6 +2,7 @@
 Client API endpoints
 """
 from fastapi import APIRouter, HTTPException, Path
+from fastapi.responses import ORJSONResponse
 from typing import List
 from app.models.client import ClientWithSuitability, SuitabilityUpdateRequest
 from app.services.data_store import data_store
@@ -41,31 +42,32 @@ async def update_client_suitability(
     Used in Replacement Opportunity module when advisor verifies/updates suitability.
     Returns the updated client profile with timestamp in frontend format.
     """
-    # Get current client
-    client = data_store.get_client(client_account_number)
-    
-    if not client:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Client {client_account_number} not found"
-        )
-    
-    # Prepare updates - only include non-None values
-    updates = suitability_update.model_dump(exclude_none=True)
+    # Prepare updates - only fields the caller actually sent with non-None values
+    updates = {
+        field: value
+        for field in suitability_update.model_fields_set
+        if (value := getattr(suitability_update, field)) is not None
+    }
     
     if not updates:
+        # Unknown client still takes precedence over an empty body
+        if not data_store.get_client(client_account_number):
+            raise HTTPException(
+                status_code=404,
+                detail=f"Client {client_account_number} not found"
+            )
         raise HTTPException(
             status_code=400,
             detail="No suitability fields provided for update"
         )
     
-    # Update the client suitability
+    # Single lookup: the store returns None when the client doesn't exist
     updated_client = data_store.update_client_suitability(client_account_number, updates)
     
     if not updated_client:
         raise HTTPException(
-            status_code=500,
-            detail="Failed to update client suitability"
+            status_code=404,
+            detail=f"Client {client_account_number} not found"
         )
     
     # Note: In a real system, we'd save the timestamp and advisor ID
@@ -119,15 +121,15 @@ async def get_all_acquisition_alerts():
     """
     all_alerts = data_store.get_all_acquisition_alerts()
     
-    # Calculate summary stats
-    total_alerts = sum(len(client_data.get("alerts", [])) for client_data in all_alerts)
-    total_potential_aum = sum(client_data.get("totalPortfolioValue", 0) * 0.15 for client_data in all_alerts)
+    # Summary stats are aggregated once when the alerts are loaded
+    totals = data_store.get_acquisition_totals()
+    total_potential_aum = totals["totalPortfolioValue"] * 0.15
     
-    return {
+    return ORJSONResponse({
         "clients": all_alerts,
         "summary": {
             "totalClients": len(all_alerts),
-            "totalAlerts": total_alerts,
+            "totalAlerts": totals["totalAlerts"],
             "estimatedNewAUM": round(total_potential_aum, 2)
         }
-    }
+    })
@@ -1,174 +1,109 @@
 """
 Policy API endpoints
 """
-from fastapi import APIRouter, HTTPException, Path, Query, Body
-from typing import List, Optional, Dict, Any
-from datetime import datetime, timedelta
+from fastapi import APIRouter, HTTPException, Path, Query, Body, Response
+from fastapi.responses import ORJSONResponse
+from typing import List, Optional, Dict, Any, Tuple
+from operator import itemgetter
+from datetime import date, datetime
 import asyncio
-from app.models.policy import Policy, PolicySummary, ClientPoliciesGroup, PolicyDetail, NonFinancialData
-from app.models.alert import AlertSummary, AlertSeverity
+import logging
+import orjson
+from app.models.policy import (
+    Policy, PolicySummary, ClientPoliciesGroup, PolicyDetail,
+    NonFinancialData, Beneficiary, ContactInfo, TaxWithholding
+)
 from app.services.data_store import data_store
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
+# Serialized GET /policies payload, rebuilt only when the data store version changes
+_grouped_cache: Dict[str, Any] = {"version": -1, "payload": b""}
+
+# Serialized policy detail per policy ID: (data version, day computed, payload).
+# Keyed on the day too because the surrender charge depends on today's date.
+_detail_cache: Dict[str, Tuple[int, date, bytes]] = {}
+
 
 def transform_policy_to_detail(policy: Policy, client_name: str = "") -> PolicyDetail:
     """
     Transform backend Policy model to frontend PolicyDetail format.
     """
     # Calculate cash surrender value (account value minus surrender charge)
-    cash_surrender_value = None
-    current_surrender_charge = None
-    
-    if policy.accountValue and policy.surrenderScheduleYears and policy.surrenderEndDate:
-        # Calculate surrender charge percentage based on years remaining
-        try:
-            end_date = datetime.strptime(policy.surrenderEndDate, "%Y-%m-%d")
-            today = datetime.now()
-            days_until_end = (end_date - today).days
-            
-            if days_until_end > 0:
-                # Calculate surrender charge (decreasing over time)
-                # Assume max 10% at start, decreasing linearly
-                total_days = policy.surrenderScheduleYears * 365
-                days_elapsed = total_days - days_until_end
-                current_surrender_charge = max(0, 10 * (days_until_end / total_days))
-                cash_surrender_value = policy.accountValue * (1 - current_surrender_charge / 100)
-            else:
-                current_surrender_charge = 0
-                cash_surrender_value = policy.accountValue
-        except:
-            pass
-    
-    if cash_surrender_value is None:
-        cash_surrender_value = policy.accountValue
-    
-    # Calculate death benefit (typically 100% - 150% of account value)
-    death_benefit = policy.accountValue * 1.0 if policy.accountValue else None
-    
-    # Convert riderType to riders array
-    riders = []
-    if policy.riderType and policy.riderType.lower() != 'none':
-        riders = [policy.riderType]
-    
-    # Add income rider if applicable
-    if policy.incomeActivated or policy.incomeBase:
-        income_rider = "Income Rider"
-        if policy.incomeBase:
-            income_rider += f" (${policy.incomeBase:,.0f})"
-        if income_rider not in riders:
-            riders.append(income_rider)
+    current_surrender_charge, cash_surrender_value = policy.surrender_values(date.today())
     
-    # Extract product name from policyLabel or use productType
-    product_name = policy.policyLabel or policy.productType
-    
-    return PolicyDetail(
-        policyId=policy.policyId,
-        clientAccountNumber=policy.clientAccountNumber,
+    # Everything else is static per policy and precomputed at load. The inputs come
+    # from already-validated models, so construct without re-running validation.
+    return PolicyDetail.model_construct(
+        **policy.detail_fields,
         clientName=client_name,
-        carrier=policy.carrier,
-        productType=policy.productType,
-        productName=product_name,
-        issueDate=policy.issueDate,
-        renewalDate=None,  # Not in source data
-        renewalDays=policy.renewalDays,
-        daysToRenewal=policy.renewalDays,  # Alias
-        contractValue=policy.accountValue,  # Map accountValue to contractValue
-        accountValue=policy.accountValue,
         cashSurrenderValue=cash_surrender_value,
-        deathBenefit=death_benefit,
         currentSurrenderCharge=current_surrender_charge,
-        surrenderEndDate=policy.surrenderEndDate,
-        currentCapRate=policy.currentCapRate,
-        projectedRenewalRate=policy.renewalCapRate,
-        riders=riders,
-        annualFee=None,  # Not in source data
-        riderFee=policy.fees.riderFee if policy.fees else None,
-        meFee=policy.fees.m_e_fee if policy.fees else None,
-        adminFee=None,  # Not in source data
         nonFinancialData=policy.nonFinancialData,
         alerts=policy.alerts
     )
 
 
-@router.get("/policies", response_model=List[ClientPoliciesGroup])
-async def get_policies_grouped_by_client():
+def _build_client_groups() -> List[Dict[str, Any]]:
     """
-    Get all policies grouped by client account.
-    This endpoint returns policies grouped by client for the policy listing dashboard.
-    Each group includes client info, policy summaries, and alert counts.
+    Group all policies by client account with alert counts,
+    sorted by total alerts (descending) then client name.
     """
-    # Get all policies
-    all_policies = data_store.get_all_policies()
-    
-    # Get clients with policies
-    clients_dict = data_store.get_clients_with_policies()
+    get_client_name = data_store.get_client_name
     
-    # Group policies by client
-    grouped: dict = {}
+    # Policies are already grouped by client in the data store - build each
+    # group dict in one go with local accumulators
+    result: List[Dict[str, Any]] = []
+    append_group = result.append
     
-    for policy in all_policies:
-        client_account = policy.clientAccountNumber
+    for client_account, policies in data_store.get_policies_by_client_map().items():
+        summaries = []
+        append_summary = summaries.append
+        hi = med = low = 0
         
-        if client_account not in grouped:
-            # Get client info
-            client_data = clients_dict.get(client_account)
-            client_name = client_data.client.clientName if client_data else "Unknown Client"
-            
-            grouped[client_account] = {
-                "clientAccountNumber": client_account,
-                "clientName": client_name,
-                "policies": [],
-                "totalAlerts": 0,
-                "highSeverityCount": 0,
-                "mediumSeverityCount": 0,
-                "lowSeverityCount": 0
-            }
+        # Summaries and severity counts are prebuilt on each policy
+        for policy in policies:
+            p_hi, p_med, p_low = policy.severity_counts
+            hi += p_hi
+            med += p_med
+            low += p_low
+            append_summary(policy.summary)
         
-        # Create policy summary
-        alert_summaries = [
-            AlertSummary(
-                alertId=alert.alertId,
-                type=alert.type,
-                severity=alert.severity,
-                title=alert.title,
-                reasonShort=alert.reasonShort
-            )
-            for alert in policy.alerts
-        ]
-        
-        policy_summary = PolicySummary(
-            policyId=policy.policyId,
-            clientAccountNumber=policy.clientAccountNumber,
-            policyLabel=policy.policyLabel,
-            carrier=policy.carrier,
-            productType=policy.productType,
-            accountValue=policy.accountValue,
-            renewalDays=policy.renewalDays,
-            currentCapRate=policy.currentCapRate,
-            renewalCapRate=policy.renewalCapRate,
-            alerts=alert_summaries
-        )
-        
-        grouped[client_account]["policies"].append(policy_summary)
-        
-        # Count alerts by severity
-        for alert in policy.alerts:
-            grouped[client_account]["totalAlerts"] += 1
-            if alert.severity == AlertSeverity.HIGH:
-                grouped[client_account]["highSeverityCount"] += 1
-            elif alert.severity == AlertSeverity.MEDIUM:
-                grouped[client_account]["mediumSeverityCount"] += 1
-            elif alert.severity == AlertSeverity.LOW:
-                grouped[client_account]["lowSeverityCount"] += 1
+        append_group({
+            "clientAccountNumber": client_account,
+            "clientName": get_client_name(client_account, "Unknown Client"),
+            "policies": summaries,
+            "totalAlerts": hi + med + low,
+            "highSeverityCount": hi,
+            "mediumSeverityCount": med,
+            "lowSeverityCount": low
+        })
+    
+    # Sort by total alerts (descending) then by client name.
+    # Two stable C-level key sorts instead of a per-element lambda.
+    result.sort(key=itemgetter("clientName"))
+    result.sort(key=itemgetter("totalAlerts"), reverse=True)
     
-    # Convert to list and return
-    result = [ClientPoliciesGroup(**group_data) for group_data in grouped.values()]
+    return result
+
+
+@router.get("/policies", response_model=List[ClientPoliciesGroup])
+async def get_policies_grouped_by_client():
+    """
+    Get all policies grouped by client account.
+    This endpoint returns policies grouped by client for the policy listing dashboard.
+    Each group includes client info, policy summaries, and alert counts.
     
-    # Sort by total alerts (descending) then by client name
-    result.sort(key=lambda x: (-x.totalAlerts, x.clientName))
+    The serialized payload is cached until the data store changes.
+    """
+    version = data_store.version
+    if _grouped_cache["version"] != version:
+        _grouped_cache["payload"] = orjson.dumps(_build_client_groups())
+        _grouped_cache["version"] = version
     
-    return result
+    return Response(content=_grouped_cache["payload"], media_type="application/json")
 
 
 @router.get("/policies/{policy_id}", response_model=PolicyDetail)
@@ -180,20 +115,22 @@ async def get_policy_detail(
     This endpoint is used when opening the Policy Detail Modal.
     Returns transformed policy data matching frontend expectations.
     """
+    # Plain in-memory dict lookups - no I/O to overlap
     policy = data_store.get_policy_by_id(policy_id)
-    
     if not policy:
         raise HTTPException(status_code=404, detail=f"Policy {policy_id} not found")
     
-    # Get client name
-    client_name = ""
-    clients_dict = data_store.get_clients_with_policies()
-    client_data = clients_dict.get(policy.clientAccountNumber)
-    if client_data:
-        client_name = client_data.client.clientName
-    
-    # Transform to frontend format
-    return transform_policy_to_detail(policy, client_name)
+    # Serve the cached payload while the data and the date are unchanged
+    version = data_store.version
+    today = date.today()
+    cached = _detail_cache.get(policy_id)
+    if cached is None or cached[0] != version or cached[1] != today:
+        client_name = data_store.get_client_name(policy.clientAccountNumber)
+        detail = transform_policy_to_detail(policy, client_name)
+        cached = (version, today, detail.model_dump_json().encode())
+        _detail_cache[policy_id] = cached
+    
+    return Response(content=cached[2], media_type="application/json")
 
 
 @router.get("/clients/{client_account_number}/policies", response_model=List[PolicySummary])
@@ -212,35 +149,28 @@ async def get_client_policies(
             detail=f"No policies found for client {client_account_number}"
         )
     
-    # Convert to summaries
-    summaries = []
-    for policy in policies:
-        alert_summaries = [
-            AlertSummary(
-                alertId=alert.alertId,
-                type=alert.type,
-                severity=alert.severity,
-                title=alert.title,
-                reasonShort=alert.reasonShort
-            )
-            for alert in policy.alerts
-        ]
-        
-        summary = PolicySummary(
-            policyId=policy.policyId,
-            clientAccountNumber=policy.clientAccountNumber,
-            policyLabel=policy.policyLabel,
-            carrier=policy.carrier,
-            productType=policy.productType,
-            accountValue=policy.accountValue,
-            renewalDays=policy.renewalDays,
-            currentCapRate=policy.currentCapRate,
-            renewalCapRate=policy.renewalCapRate,
-            alerts=alert_summaries
-        )
-        summaries.append(summary)
+    # Policy summaries are prebuilt on each policy
+    summaries = [policy.summary for policy in policies]
+    
+    return ORJSONResponse(summaries)
+
+
+async def _simulate_dtcc_call(policy_id: str, submitted_at: datetime) -> str:
+    """Mock DTCC Administrative API round trip - returns the DTCC transaction ID"""
+    # Simulate DTCC API processing delay (1-2 seconds)
+    await asyncio.sleep(1.5)
+    return f"DTCC-{submitted_at.strftime('%Y%m%d')}-{policy_id[-6:]}"
+
+
+async def _apply_local_update(policy: Policy, non_financial: NonFinancialData) -> None:
+    """Apply a non-financial update to the in-memory policy"""
+    policy.nonFinancialData = non_financial
+    
+    # Remove MISSING_INFO alert from policy
+    policy.alerts = [alert for alert in policy.alerts if alert.type != "MISSING_INFO"]
     
-    return summaries
+    # Update in data store
+    data_store.update_policy(policy)
 
 
 @router.post("/policies/{policy_id}/update-non-financial")
@@ -269,8 +199,8 @@ async def update_policy_non_financial_data(
     if not policy:
         raise HTTPException(status_code=404, detail=f"Policy {policy_id} not found")
     
-    # Simulate DTCC API processing delay (1-2 seconds)
-    await asyncio.sleep(1.5)
+    now = datetime.now()
+    timestamp = now.isoformat()
     
     # Extract data from request
     account_profile_data = update_data.get("accountProfileData", {})
@@ -281,7 +211,7 @@ async def update_policy_non_financial_data(
         "policy_id": policy_id,
         "carrier": policy.carrier,
         "transaction_type": "ADMINISTRATIVE_UPDATE",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": timestamp,
         "updates": {
             "owner_name": account_profile_data.get("ownerName"),
             "owner_ssn": account_profile_data.get("ssn"),
@@ -295,21 +225,11 @@ async def update_policy_non_financial_data(
         }
     }
     
-    # Log the DTCC payload (for hackathon demonstration)
-    print("\n" + "=" * 60)
-    print("🔵 DTCC ADMINISTRATIVE API - MOCK SUBMISSION")
-    print("=" * 60)
-    print(f"Policy ID: {policy_id}")
-    print(f"Carrier: {policy.carrier}")
-    print(f"Transaction Type: Administrative Update (Non-Financial)")
-    print("\nPayload that would be sent to DTCC:")
-    import json
-    print(json.dumps(dtcc_payload, indent=2))
-    print("=" * 60 + "\n")
+    # Log the DTCC payload (for hackathon demonstration) - lazy formatting, nothing is
+    # rendered unless INFO is enabled for app.* (settings.LOG_LEVEL)
+    logger.info("DTCC mock submission: policy=%s carrier=%s payload=%s", policy_id, policy.carrier, dtcc_payload)
     
     # Update policy's nonFinancialData
-    from app.models.policy import Beneficiary, ContactInfo, TaxWithholding
-    
     primary_ben_data = policy_specific_data.get("primaryBeneficiary")
     contingent_ben_data = policy_specific_data.get("contingentBeneficiary")
     tax_data = policy_specific_data.get("taxWithholding")
@@ -327,20 +247,14 @@ async def update_policy_non_financial_data(
         ),
         taxWithholding=TaxWithholding(**tax_data) if tax_data else None,
         specialInstructions=policy_specific_data.get("specialInstructions", ""),
-        lastUpdated=datetime.now().isoformat()
+        lastUpdated=timestamp
     )
     
-    # Update the policy
-    policy.nonFinancialData = updated_non_financial
-    
-    # Remove MISSING_INFO alert from policy
-    policy.alerts = [alert for alert in policy.alerts if alert.type != "MISSING_INFO"]
-    
-    # Update in data store
-    data_store.update_policy(policy)
-    
-    # Generate mock DTCC transaction ID
-    mock_transaction_id = f"DTCC-{datetime.now().strftime('%Y%m%d')}-{policy_id[-6:]}"
+    # Apply the in-memory update while the (simulated) DTCC call is in flight
+    mock_transaction_id, _ = await asyncio.gather(
+        _simulate_dtcc_call(policy_id, now),
+        _apply_local_update(policy, updated_non_financial)
+    )
     
     # Track which fields were updated
     updated_fields = []
@@ -357,6 +271,6 @@ async def update_policy_non_financial_data(
         "dtccTransactionId": mock_transaction_id,
         "message": "Policy updated successfully via DTCC Administrative API",
         "updatedFields": updated_fields,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": timestamp,
         "mockNote": "This is a simulated DTCC integration for hackathon purposes"
     }
@@ -19,16 +19,18 @@ async def get_all_products(
     Get all products in the catalog.
     Optionally filter by product type or carrier.
     """
-    products = data_store.get_all_products()
-    
-    # Apply filters
+    # Use the data store indexes; narrow by carrier within the type bucket if both are given
     if product_type:
-        products = [p for p in products if p.productType == product_type]
+        products = data_store.get_products_by_type(product_type)
+        if carrier:
+            carrier_key = carrier.lower()
+            products = [p for p in products if p.carrier.lower() == carrier_key]
+        return products
     
     if carrier:
-        products = [p for p in products if p.carrier.lower() == carrier.lower()]
+        return data_store.get_products_by_carrier(carrier)
     
-    return products
+    return data_store.get_all_products()
 
 
 @router.get("/products/{product_id}", response_model=Product)
@@ -5,124 +5,246 @@ This module provides endpoints for creating, validating, and submitting
 replacement transactions using the standard payload format.
 """
 from fastapi import APIRouter, HTTPException, status
-from typing import List, Optional
-from datetime import datetime
-import uuid
+from fastapi.responses import ORJSONResponse
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from collections import OrderedDict, defaultdict
+from itertools import islice
+from datetime import datetime, timezone
+from secrets import token_hex
 
 from app.models.replacement_transaction import (
     ReplacementTransactionPayload,
     TransactionSubmissionResponse,
     TransactionValidationResponse,
     TransactionStatus,
-    TransactionType,
     ExchangeType
 )
-from app.models.policy import Policy
-from app.models.product import Product
-from app.models.client import ClientWithSuitability
 from app.services.data_store import data_store
+from app.config import settings
 
 
-router = APIRouter(prefix="/replacement-transactions", tags=["Replacement Transactions"])
+router = APIRouter(
+    prefix="/replacement-transactions",
+    tags=["Replacement Transactions"],
+    default_response_class=ORJSONResponse
+)
 
 
-# In-memory storage for demo (replace with database in production)
-transactions_db = {}
+# In-memory storage for demo (replace with database in production).
+# Bounded LRU: reads move a transaction to the end, the least recently used
+# entry is evicted once TRANSACTIONS_MAX is exceeded.
+transactions_db: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
 
+# Secondary indexes over transactions_db: transaction IDs in submission order
+# (dicts used as insertion-ordered sets). Listings always walk these rather than
+# transactions_db itself, whose order changes on every read.
+_submitted: Dict[str, None] = {}
+_by_client: Dict[str, Dict[str, None]] = defaultdict(dict)
+_by_status: Dict[TransactionStatus, Dict[str, None]] = defaultdict(dict)
 
-@router.post("/validate", response_model=TransactionValidationResponse)
-async def validate_replacement_transaction(payload: ReplacementTransactionPayload):
-    """
-    Validate a replacement transaction payload without submitting it.
-    
-    Performs checks for:
-    - Required field completeness
-    - Suitability requirements
-    - Compliance checklist items
-    - State-specific rules
-    - Premium calculations
-    """
-    errors = []
-    warnings = []
-    missing_fields = []
-    compliance_flags = []
-    
-    # Basic validation
-    if payload.newProduct.initialPremium != (
-        payload.newProduct.exchangeAmount + payload.newProduct.additionalPremium
-    ):
-        errors.append("Initial premium does not equal exchange amount plus additional premium")
-    
+
+def _client_key(txn: Dict[str, Any]) -> Optional[str]:
+    """Client account a transaction belongs to (carried in the external system refs)"""
+    return txn["payload"].externalSystemRefs.get("clientAccountNumber")
+
+
+def _unindex_transaction(transaction_id: str, txn: Dict[str, Any]) -> None:
+    """Remove a transaction from the submission/client/status indexes, dropping emptied buckets"""
+    _submitted.pop(transaction_id, None)
+    for index, key in ((_by_client, _client_key(txn)), (_by_status, txn["status"])):
+        bucket = index.get(key)
+        if bucket is not None:
+            bucket.pop(transaction_id, None)
+            if not bucket:
+                del index[key]
+
+
+def _store_transaction(transaction_id: str, txn: Dict[str, Any]) -> None:
+    """Save a transaction, keep the client/status indexes in sync and enforce the size bound"""
+    previous = transactions_db.get(transaction_id)
+    if previous is not None:
+        _unindex_transaction(transaction_id, previous)
+    
+    transactions_db[transaction_id] = txn
+    transactions_db.move_to_end(transaction_id)
+    _submitted[transaction_id] = None
+    _by_client[_client_key(txn)][transaction_id] = None
+    _by_status[txn["status"]][transaction_id] = None
+    
+    while len(transactions_db) > settings.TRANSACTIONS_MAX:
+        evicted_id, evicted = transactions_db.popitem(last=False)
+        _unindex_transaction(evicted_id, evicted)
+
+
+def _get_transaction(transaction_id: str) -> Dict[str, Any]:
+    """Look up a transaction (marking it recently used) or raise 404"""
+    txn = transactions_db.get(transaction_id)
+    if txn is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Transaction {transaction_id} not found"
+        )
+    transactions_db.move_to_end(transaction_id)
+    return txn
+
+
+def _transaction_row(transaction_id: str, txn: Dict[str, Any]) -> Dict[str, Any]:
+    """Listing row for a stored transaction"""
+    payload = txn["payload"]
+    return {
+        "transactionId": transaction_id,
+        "status": txn.get("status"),
+        "createdAt": payload.createdTimestamp,
+        "submittedAt": txn.get("submittedAt"),
+        "confirmationNumber": txn.get("confirmationNumber"),
+        "client": payload.client.firstName + " " + payload.client.lastName,
+        "newCarrier": payload.newProduct.carrier,
+        "amount": payload.newProduct.initialPremium
+    }
+
+
+_1035_EXCHANGE_TYPES = frozenset({ExchangeType.FULL_1035, ExchangeType.PARTIAL_1035})
+
+Rule = Tuple[Callable[[ReplacementTransactionPayload], bool], str, str]
+
+# Rule tables: (check that must pass, level, message). Evaluated in order;
+# a failing check appends its message to the list for its level. Split around
+# the computed beneficiary check so messages keep their original order.
+_RULES_BEFORE_BENEFICIARIES: Tuple[Rule, ...] = (
     # Suitability checks
-    if not payload.suitabilityProfile.understandsReplacement:
-        compliance_flags.append("Client understanding of replacement not confirmed")
-    
-    if not payload.suitabilityProfile.comparedAlternatives:
-        warnings.append("Client did not compare multiple alternatives")
+    (lambda p: p.suitabilityProfile.understandsReplacement,
+     "compliance", "Client understanding of replacement not confirmed"),
+    (lambda p: p.suitabilityProfile.comparedAlternatives,
+     "warning", "Client did not compare multiple alternatives"),
     
     # Compliance checks
-    if not payload.complianceChecklist.replacementFormSigned:
-        errors.append("State replacement form not signed")
-    
-    if not payload.complianceChecklist.suitabilityReviewCompleted:
-        errors.append("Suitability review not completed")
-    
-    if not payload.complianceChecklist.isSuitable:
-        errors.append("Transaction determined not suitable")
+    (lambda p: p.complianceChecklist.replacementFormSigned,
+     "error", "State replacement form not signed"),
+    (lambda p: p.complianceChecklist.suitabilityReviewCompleted,
+     "error", "Suitability review not completed"),
+    (lambda p: p.complianceChecklist.isSuitable,
+     "error", "Transaction determined not suitable"),
     
     # 1035 Exchange validation
-    if payload.exchangeType in [ExchangeType.FULL_1035, ExchangeType.PARTIAL_1035]:
-        if not payload.complianceChecklist.is1035Exchange:
-            errors.append("Exchange type indicates 1035 but compliance checklist not marked")
-        if not payload.complianceChecklist.exchangeFormCompleted:
-            errors.append("1035 exchange form not completed")
-    
-    # Beneficiary validation
-    primary_beneficiaries = [b for b in payload.beneficiaries if b.beneficiaryType == "PRIMARY"]
-    if primary_beneficiaries:
-        total_primary_percent = sum(b.allocationPercent for b in primary_beneficiaries)
-        if abs(total_primary_percent - 100.0) > 0.01:
-            errors.append(f"Primary beneficiary allocations total {total_primary_percent}%, must equal 100%")
-    else:
-        warnings.append("No primary beneficiaries designated")
-    
+    (lambda p: p.exchangeType not in _1035_EXCHANGE_TYPES or p.complianceChecklist.is1035Exchange,
+     "error", "Exchange type indicates 1035 but compliance checklist not marked"),
+    (lambda p: p.exchangeType not in _1035_EXCHANGE_TYPES or p.complianceChecklist.exchangeFormCompleted,
+     "error", "1035 exchange form not completed"),
+)
+
+_RULES_AFTER_BENEFICIARIES: Tuple[Rule, ...] = (
     # Age validation for new product
-    client_age = payload.client.age
     # Would check against product.ageMin and product.ageMax if we had product data
-    if client_age < 18:
-        errors.append("Client age below minimum (18)")
-    if client_age > 85:
-        warnings.append("Client age above typical maximum (85) - may require underwriting")
+    (lambda p: p.client.age >= 18,
+     "error", "Client age below minimum (18)"),
+    (lambda p: p.client.age <= 85,
+     "warning", "Client age above typical maximum (85) - may require underwriting"),
     
     # Surrender charge warning
-    if payload.currentPolicy.surrenderCharge and payload.currentPolicy.surrenderCharge > 0:
-        if not payload.currentPolicy.surrenderChargeJustification:
-            warnings.append("Surrender charges apply but no justification provided")
+    (lambda p: not p.currentPolicy.surrenderCharge or p.currentPolicy.surrenderCharge <= 0
+               or bool(p.currentPolicy.surrenderChargeJustification),
+     "warning", "Surrender charges apply but no justification provided"),
     
     # State approval check
-    if payload.complianceChecklist.stateApprovalRequired and not payload.complianceChecklist.stateApprovalReceived:
-        errors.append("State approval required but not received")
+    (lambda p: not p.complianceChecklist.stateApprovalRequired or p.complianceChecklist.stateApprovalReceived,
+     "error", "State approval required but not received"),
     
     # Advisor licensing
-    if not payload.advisor.hasCarrierAppointment:
-        errors.append("Advisor does not have carrier appointment")
-    
-    if not payload.advisor.hasProductTraining:
-        warnings.append("Advisor has not completed product training")
+    (lambda p: p.advisor.hasCarrierAppointment,
+     "error", "Advisor does not have carrier appointment"),
+    (lambda p: p.advisor.hasProductTraining,
+     "warning", "Advisor has not completed product training"),
     
     # Tax withholding validation
-    if payload.taxWithholding.federalWithholding:
-        if not payload.taxWithholding.federalPercent and not payload.taxWithholding.federalFlatAmount:
-            errors.append("Federal withholding elected but no percentage or amount specified")
+    (lambda p: not p.taxWithholding.federalWithholding
+               or bool(p.taxWithholding.federalPercent or p.taxWithholding.federalFlatAmount),
+     "error", "Federal withholding elected but no percentage or amount specified"),
     
     # W-9 requirement
-    if not payload.taxWithholding.w9OnFile:
-        errors.append("W-9 form not on file")
+    (lambda p: p.taxWithholding.w9OnFile,
+     "error", "W-9 form not on file"),
+)
+
+
+def _apply_rules(
+    rules: Tuple[Rule, ...],
+    payload: ReplacementTransactionPayload,
+    targets: Dict[str, List[str]],
+    fast_fail: bool
+) -> bool:
+    """Evaluate a rule table into `targets`; returns True if fast_fail stopped at an error"""
+    for check, level, message in rules:
+        if not check(payload):
+            targets[level].append(message)
+            if fast_fail and level == "error":
+                return True
+    return False
+
+
+def _run_validation_rules(
+    payload: ReplacementTransactionPayload,
+    fast_fail: bool = False
+) -> Tuple[List[str], List[str], List[str], List[str]]:
+    """
+    Run the business/compliance rule checks on an already-validated payload.
+    Returns (errors, warnings, missing_fields, compliance_flags).
+    With fast_fail, stops at the first error (for callers that only need validity).
+    """
+    errors = []
+    warnings = []
+    missing_fields = []
+    compliance_flags = []
+    result = (errors, warnings, missing_fields, compliance_flags)
+    
+    # Basic validation
+    if payload.newProduct.initialPremium != (
+        payload.newProduct.exchangeAmount + payload.newProduct.additionalPremium
+    ):
+        errors.append("Initial premium does not equal exchange amount plus additional premium")
+        if fast_fail:
+            return result
+    
+    targets = {"error": errors, "warning": warnings, "compliance": compliance_flags}
+    if _apply_rules(_RULES_BEFORE_BENEFICIARIES, payload, targets, fast_fail):
+        return result
+    
+    # Beneficiary validation - count and total the primary beneficiaries in one pass
+    primary_count = 0
+    total_primary_percent = 0.0
+    for beneficiary in payload.beneficiaries:
+        if beneficiary.beneficiaryType == "PRIMARY":
+            primary_count += 1
+            total_primary_percent += beneficiary.allocationPercent
+    
+    if not primary_count:
+        warnings.append("No primary beneficiaries designated")
+    elif abs(total_primary_percent - 100.0) > 0.01:
+        errors.append(f"Primary beneficiary allocations total {total_primary_percent}%, must equal 100%")
+        if fast_fail:
+            return result
+    
+    _apply_rules(_RULES_AFTER_BENEFICIARIES, payload, targets, fast_fail)
     
-    is_valid = len(errors) == 0
+    return result
+
+
+@router.post("/validate", response_model=TransactionValidationResponse)
+async def validate_replacement_transaction(payload: ReplacementTransactionPayload):
+    """
+    Validate a replacement transaction payload without submitting it.
     
-    return TransactionValidationResponse(
-        isValid=is_valid,
+    Performs checks for:
+    - Required field completeness
+    - Suitability requirements
+    - Compliance checklist items
+    - State-specific rules
+    - Premium calculations
+    """
+    errors, warnings, missing_fields, compliance_flags = _run_validation_rules(payload)
+    
+    # Built from the rule lists above - skip re-validation
+    return TransactionValidationResponse.model_construct(
+        isValid=len(errors) == 0,
         errors=errors,
         warnings=warnings,
         missingFields=missing_fields,
@@ -142,26 +264,28 @@ async def submit_replacement_transaction(payload: ReplacementTransactionPayload)
     4. Create workflow tracking
     5. Store transaction record
     """
-    # Validate first
-    validation = await validate_replacement_transaction(payload)
+    # Validate first - FastAPI already parsed the payload, so only the rules run here.
+    # Any error rejects the submission, so stop at the first one (/validate reports them all)
+    errors, warnings, _, _ = _run_validation_rules(payload, fast_fail=True)
     
-    if not validation.isValid:
+    if errors:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail={
                 "message": "Transaction validation failed",
-                "errors": validation.errors,
-                "warnings": validation.warnings
+                "errors": errors,
+                "warnings": warnings
             }
         )
     
-    # Store transaction
-    transactions_db[payload.transactionId] = {
-        "payload": payload.model_dump(),
+    # Store transaction (payload kept as the model; dumped on read)
+    confirmation_number = f"CONF-{token_hex(4).upper()}"
+    _store_transaction(payload.transactionId, {
+        "payload": payload,
         "status": TransactionStatus.SUBMITTED,
-        "submittedAt": datetime.utcnow().isoformat(),
-        "confirmationNumber": f"CONF-{uuid.uuid4().hex[:8].upper()}"
-    }
+        "submittedAt": datetime.now(timezone.utc).replace(tzinfo=None).isoformat(),
+        "confirmationNumber": confirmation_number
+    })
     
     # Here you would integrate with actual order entry systems:
     # - Carrier API submission
@@ -179,16 +303,17 @@ async def submit_replacement_transaction(payload: ReplacementTransactionPayload)
     if payload.complianceChecklist.freeLookPeriodDisclosed:
         next_steps.append(f"Free look period: {payload.complianceChecklist.freeLookDays} days from delivery")
     
-    return TransactionSubmissionResponse(
+    # Built from server-side values - skip re-validation
+    return TransactionSubmissionResponse.model_construct(
         success=True,
         transactionId=payload.transactionId,
-        confirmationNumber=transactions_db[payload.transactionId]["confirmationNumber"],
+        confirmationNumber=confirmation_number,
         status=TransactionStatus.SUBMITTED,
         message="Transaction submitted successfully",
         nextSteps=next_steps,
         estimatedCompletionDate=None,  # Would calculate based on carrier SLA
         errors=[],
-        warnings=validation.warnings
+        warnings=warnings
     )
 
 
@@ -197,13 +322,8 @@ async def get_replacement_transaction(transaction_id: str):
     """
     Retrieve a replacement transaction by ID.
     """
-    if transaction_id not in transactions_db:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Transaction {transaction_id} not found"
-        )
-    
-    return transactions_db[transaction_id]
+    txn = _get_transaction(transaction_id)
+    return {**txn, "payload": txn["payload"].model_dump()}
 
 
 @router.get("/{transaction_id}/status")
@@ -211,13 +331,7 @@ async def get_transaction_status(transaction_id: str):
     """
     Get current status of a replacement transaction.
     """
-    if transaction_id not in transactions_db:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Transaction {transaction_id} not found"
-        )
-    
-    txn = transactions_db[transaction_id]
+    txn = _get_transaction(transaction_id)
     return {
         "transactionId": transaction_id,
         "status": txn["status"],
@@ -227,6 +341,75 @@ async def get_transaction_status(transaction_id: str):
     }
 
 
+# Static parts of the create-from-context template, built once at import.
+# Only flat scalar dicts - each request merges them into fresh dicts.
+_STATIC_TRANSACTION_FIELDS = {
+    "transactionType": "EXTERNAL_1035_EXCHANGE",
+    "exchangeType": "FULL_1035",
+    "premiumSource": "EXCHANGE_PROCEEDS",
+    "status": "INITIATED",
+    "sourceSystem": "AnnuityReviewAI",
+}
+
+_STATIC_CLIENT_FIELDS = {
+    "ssn": "***-**-****",  # Masked
+    "dateOfBirth": "",  # Would need
+    "gender": "M",  # Would need
+    "address": "",  # Would need
+    "city": "",
+    "zipCode": "",
+    "phone": "",
+    "email": "",
+    "employmentStatus": "Employed",  # Would derive from lifeStage
+}
+
+_STATIC_SUITABILITY_CONFIRMATIONS = {
+    "surrenderChargeAcceptance": True,  # UI would confirm
+    "futureIncomeNeeded": True,
+    "understandsReplacement": False,  # UI must confirm
+    "comparedAlternatives": False,  # UI must confirm
+    "reviewedSurrenderCharges": False  # UI must confirm
+}
+
+_STATIC_COMPLIANCE = {
+    "replacementFormSigned": False,
+    "suitabilityReviewCompleted": False,
+    "isSuitable": False,
+    "bestInterestDetermination": False,
+    "alternativesConsidered": 0,
+    "is1035Exchange": True,
+    "exchangeFormCompleted": False,
+    "stateApprovalRequired": False,
+    "stateApprovalReceived": False,
+    "freeLookPeriodDisclosed": False,
+    "freeLookDays": 30
+}
+
+_STATIC_ADVISOR = {
+    "advisorId": "ADV-12345",
+    "firstName": "Jane",
+    "lastName": "Advisor",
+    "email": "jadvisor@firm.com",
+    "phone": "555-1234",
+    "licenseNumber": "LIC-12345",
+    "completedCE": True,
+    "firmName": "Advisory Firm LLC"
+}
+
+_STATIC_TAX = {
+    "federalWithholding": False,
+    "stateWithholding": False,
+    "w9OnFile": False
+}
+
+_TEMPLATE_NOTES = (
+    "This is a TEMPLATE with default values",
+    "UI must populate missing required fields",
+    "Compliance checklist items must be completed",
+    "Client confirmations required before submission"
+)
+
+
 @router.post("/create-from-context")
 async def create_transaction_from_context(
     policy_id: str,
@@ -264,20 +447,28 @@ async def create_transaction_from_context(
             detail=f"Client {client_account_number} not found"
         )
     
+    # One clock read per request: UTC for the timestamp, local time for the dates
+    now_utc = datetime.now(timezone.utc)
+    now_local = now_utc.astimezone()
+    
     # Generate transaction ID
-    transaction_id = f"TXN-{datetime.now().strftime('%Y%m%d')}-{uuid.uuid4().hex[:8].upper()}"
+    transaction_id = f"TXN-{now_local.strftime('%Y%m%d')}-{token_hex(4).upper()}"
+    
+    # Values used in several places below - compute once
+    account_value = policy.accountValue
+    account_value_str = str(account_value)
+    profile = client.clientSuitabilityProfile
+    name_parts = client.client.clientName.split() if client.client.clientName else []
+    owner_name = policy.nonFinancialData.ownerName if policy.nonFinancialData else ""
+    has_income_rider = policy.riderType != "None"
     
     # Create payload structure (with defaults - UI would customize)
     # This is a TEMPLATE that the UI can populate with actual user selections
     template = {
         "transactionId": transaction_id,
-        "transactionType": "EXTERNAL_1035_EXCHANGE",
-        "exchangeType": "FULL_1035",
-        "premiumSource": "EXCHANGE_PROCEEDS",
-        "status": "INITIATED",
-        "createdDate": datetime.now().strftime("%Y-%m-%d"),
-        "createdTimestamp": datetime.utcnow().isoformat() + "Z",
-        "sourceSystem": "AnnuityReviewAI",
+        **_STATIC_TRANSACTION_FIELDS,
+        "createdDate": now_local.strftime("%Y-%m-%d"),
+        "createdTimestamp": now_utc.replace(tzinfo=None).isoformat() + "Z",
         
         # Current policy info (from policy data)
         "currentPolicy": {
@@ -285,21 +476,21 @@ async def create_transaction_from_context(
             "carrier": policy.carrier,
             "productName": policy.policyLabel,
             "productType": policy.productType,
-            "accountValue": str(policy.accountValue),
-            "surrenderValue": str(policy.accountValue),  # Would calculate actual surrender value
+            "accountValue": account_value_str,
+            "surrenderValue": account_value_str,  # Would calculate actual surrender value
             "surrenderCharge": "0.00",  # Would calculate from policy.surrenderScheduleYears
             "issueDate": policy.issueDate,
-            "ownerName": policy.nonFinancialData.ownerName if policy.nonFinancialData else "",
+            "ownerName": owner_name,
             "ownerSSN": policy.nonFinancialData.ownerSSN if policy.nonFinancialData else "",
-            "annuitantName": policy.nonFinancialData.ownerName if policy.nonFinancialData else "",
+            "annuitantName": owner_name,
             "annuitantDOB": "",  # Would need from client data
             "qualifiedStatus": "NON_QUALIFIED",  # Would determine from policy
-            "costBasis": str(policy.accountValue * 0.8),  # Example - would need actual
-            "hasIncomeRider": policy.riderType != "None",
-            "incomeRiderName": policy.riderType if policy.riderType != "None" else None,
+            "costBasis": str(account_value * 0.8),  # Example - would need actual
+            "hasIncomeRider": has_income_rider,
+            "incomeRiderName": policy.riderType if has_income_rider else None,
             "incomeBase": str(policy.incomeBase) if policy.incomeBase else None,
             "isIncomeActivated": policy.incomeActivated,
-            "replacementReason": [alert.reasonShort for alert in policy.alerts[:3]] if policy.alerts else []
+            "replacementReason": policy.top_reasons
         },
         
         # New product info
@@ -308,35 +499,27 @@ async def create_transaction_from_context(
             "carrier": product.carrier,
             "productName": product.productName,
             "productType": product.productType,
-            "initialPremium": str(policy.accountValue),
-            "exchangeAmount": str(policy.accountValue),
+            "initialPremium": account_value_str,
+            "exchangeAmount": account_value_str,
             "additionalPremium": "0.00",
             "selectedIndexOptions": [],  # UI would populate
             "selectedRiders": [],  # UI would populate
             "bonusRate": product.bonusRate,
-            "bonusAmount": str(policy.accountValue * (product.bonusRate or 0) / 100) if product.bonusRate else None
+            "bonusAmount": str(account_value * product.bonusRate / 100) if product.bonusRate else None
         },
         
         # Client info (from client profile)
         "client": {
-            "firstName": client.client.clientName.split()[0] if client.client.clientName else "",
-            "lastName": " ".join(client.client.clientName.split()[1:]) if len(client.client.clientName.split()) > 1 else "",
-            "ssn": "***-**-****",  # Masked
-            "dateOfBirth": "",  # Would need
-            "age": client.clientSuitabilityProfile.age,
-            "gender": "M",  # Would need
-            "citizenship": client.clientSuitabilityProfile.citizenship,
-            "state": client.clientSuitabilityProfile.state,
-            "address": "",  # Would need
-            "city": "",
-            "zipCode": "",
-            "phone": "",
-            "email": "",
-            "annualIncome": client.clientSuitabilityProfile.annualIncomeRange,
-            "netWorth": client.clientSuitabilityProfile.netWorthRange,
-            "liquidNetWorth": client.clientSuitabilityProfile.liquidNetWorthRange,
-            "taxBracket": client.clientSuitabilityProfile.taxBracket,
-            "employmentStatus": "Employed",  # Would derive from lifeStage
+            **_STATIC_CLIENT_FIELDS,
+            "firstName": name_parts[0] if name_parts else "",
+            "lastName": " ".join(name_parts[1:]),
+            "age": profile.age,
+            "citizenship": profile.citizenship,
+            "state": profile.state,
+            "annualIncome": profile.annualIncomeRange,
+            "netWorth": profile.netWorthRange,
+            "liquidNetWorth": profile.liquidNetWorthRange,
+            "taxBracket": profile.taxBracket,
         },
         
         # Annuitant (same as owner for simplicity)
@@ -349,57 +532,30 @@ async def create_transaction_from_context(
         
         # Suitability (from client profile)
         "suitabilityProfile": {
-            "riskTolerance": client.clientSuitabilityProfile.riskTolerance,
-            "investmentObjective": client.clientSuitabilityProfile.primaryObjective,
-            "investmentExperience": client.clientSuitabilityProfile.investmentExperience,
-            "investmentHorizon": client.clientSuitabilityProfile.investmentHorizon,
-            "liquidityNeeds": client.clientSuitabilityProfile.liquidityImportance,
-            "timeHorizon": client.clientSuitabilityProfile.investmentHorizon,
-            "surrenderChargeAcceptance": True,  # UI would confirm
-            "currentIncomeNeeded": client.clientSuitabilityProfile.currentIncomeNeed == "Now",
-            "futureIncomeNeeded": True,
-            "incomeStartYear": client.clientSuitabilityProfile.retirementTargetYear,
-            "understandsReplacement": False,  # UI must confirm
-            "comparedAlternatives": False,  # UI must confirm
-            "reviewedSurrenderCharges": False  # UI must confirm
+            "riskTolerance": profile.riskTolerance,
+            "investmentObjective": profile.primaryObjective,
+            "investmentExperience": profile.investmentExperience,
+            "investmentHorizon": profile.investmentHorizon,
+            "liquidityNeeds": profile.liquidityImportance,
+            "timeHorizon": profile.investmentHorizon,
+            "currentIncomeNeeded": profile.currentIncomeNeed == "Now",
+            "incomeStartYear": profile.retirementTargetYear,
+            **_STATIC_SUITABILITY_CONFIRMATIONS
         },
         
         # Compliance checklist (defaults - UI must complete)
-        "complianceChecklist": {
-            "replacementFormSigned": False,
-            "suitabilityReviewCompleted": False,
-            "isSuitable": False,
-            "bestInterestDetermination": False,
-            "alternativesConsidered": 0,
-            "is1035Exchange": True,
-            "exchangeFormCompleted": False,
-            "stateApprovalRequired": False,
-            "stateApprovalReceived": False,
-            "freeLookPeriodDisclosed": False,
-            "freeLookDays": 30
-        },
+        "complianceChecklist": dict(_STATIC_COMPLIANCE),
         
         # Advisor info (would come from session/user context)
         "advisor": {
-            "advisorId": "ADV-12345",
-            "firstName": "Jane",
-            "lastName": "Advisor",
-            "email": "jadvisor@firm.com",
-            "phone": "555-1234",
-            "licenseNumber": "LIC-12345",
-            "licenseState": client.clientSuitabilityProfile.state,
+            **_STATIC_ADVISOR,
+            "licenseState": profile.state,
             "hasCarrierAppointment": product.hasAppointment,
             "hasProductTraining": product.hasTraining,
-            "completedCE": True,
-            "firmName": "Advisory Firm LLC"
         },
         
         # Tax withholding
-        "taxWithholding": {
-            "federalWithholding": False,
-            "stateWithholding": False,
-            "w9OnFile": False
-        },
+        "taxWithholding": dict(_STATIC_TAX),
         
         # Qualified status
         "qualifiedStatus": "NON_QUALIFIED",
@@ -412,17 +568,13 @@ async def create_transaction_from_context(
         }
     }
     
-    return {
+    # Template is built from plain values - hand it straight to orjson
+    return ORJSONResponse({
         "message": "Transaction template created from context",
         "transactionId": transaction_id,
         "template": template,
-        "notes": [
-            "This is a TEMPLATE with default values",
-            "UI must populate missing required fields",
-            "Compliance checklist items must be completed",
-            "Client confirmations required before submission"
-        ]
-    }
+        "notes": list(_TEMPLATE_NOTES)
+    })
 
 
 @router.get("/")
@@ -434,29 +586,19 @@ async def list_transactions(
     """
     List replacement transactions with optional filters.
     """
-    results = []
-    for txn_id, txn_data in transactions_db.items():
-        payload_dict = txn_data.get("payload", {})
-        
-        # Apply filters
-        if client_account_number and payload_dict.get("client", {}).get("accountNumber") != client_account_number:
-            continue
-        if status and txn_data.get("status") != status:
-            continue
-        
-        results.append({
-            "transactionId": txn_id,
-            "status": txn_data.get("status"),
-            "createdAt": payload_dict.get("createdTimestamp"),
-            "submittedAt": txn_data.get("submittedAt"),
-            "confirmationNumber": txn_data.get("confirmationNumber"),
-            "client": payload_dict.get("client", {}).get("firstName", "") + " " + payload_dict.get("client", {}).get("lastName", ""),
-            "newCarrier": payload_dict.get("newProduct", {}).get("carrier"),
-            "amount": payload_dict.get("newProduct", {}).get("initialPremium")
-        })
-        
-        if len(results) >= limit:
-            break
+    # Narrow the candidates with the secondary indexes instead of scanning everything
+    if client_account_number and status:
+        by_client = _by_client.get(client_account_number, {})
+        by_status = _by_status.get(status, {})
+        txn_ids = (txn_id for txn_id in by_client if txn_id in by_status)
+    elif client_account_number:
+        txn_ids = iter(_by_client.get(client_account_number, {}))
+    elif status:
+        txn_ids = iter(_by_status.get(status, {}))
+    else:
+        txn_ids = iter(_submitted)
+    
+    results = [_transaction_row(txn_id, transactions_db[txn_id]) for txn_id in islice(txn_ids, limit)]
     
     return {
         "total": len(results),
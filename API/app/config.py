@@ -21,6 +21,9 @@ class Settings(BaseSettings):
         "http://127.0.0.1:4200",
     ]
     
+    # Logging
+    LOG_LEVEL: str = "INFO"  # Level for the app.* loggers (e.g. the mock DTCC payload log)
+    
     # Data paths
     BASE_DIR: Path = Path(__file__).resolve().parent.parent
     DATA_DIR: Path = BASE_DIR / "data"
@@ -33,6 +36,11 @@ class Settings(BaseSettings):
     AI_MODEL: str = "gpt-4"
     AI_API_KEY: str = ""
     AI_MOCK_MODE: bool = True  # Use mock responses for hackathon
+    AI_BATCH_MAX: int = 16  # Max chat requests per provider batch (1 disables batching)
+    AI_BATCH_MAX_WAIT_MS: int = 20  # How long to hold a batch open for more requests
+    
+    # Replacement transactions (in-memory store)
+    TRANSACTIONS_MAX: int = 10_000  # Least recently used transactions are evicted beyond this
     
     # Alert Engine Settings
     REPLACEMENT_RENEWAL_DAYS_THRESHOLD: int = 30
@@ -1,9 +1,8 @@
 """
 Alert data models
 """
-from pydantic import BaseModel, Field
-from typing import List, Literal
-from datetime import date
+from pydantic import BaseModel, Field, PrivateAttr
+from typing import List, Dict, Any, Optional
 from enum import Enum
 
 
@@ -42,8 +41,25 @@ class Alert(BaseModel):
     reasonShort: str = Field(..., description="Short reason for the alert")
     reasons: List[str] = Field(default_factory=list, description="Detailed reasons")
     createdAt: str = Field(..., description="Alert creation date")
+    
+    # AlertSummary fields, built on first use and reused by the listing endpoints
+    _summary: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+    
+    @property
+    def summary(self) -> Dict[str, Any]:
+        """Condensed alert (AlertSummary fields) for listing views - treat as read-only"""
+        if self._summary is None:
+            self._summary = {
+                "alertId": self.alertId,
+                "type": self.type,
+                "severity": self.severity,
+                "title": self.title,
+                "reasonShort": self.reasonShort
+            }
+        return self._summary
 
     class Config:
+        frozen = True  # Fields never change after load, so the cached summary stays valid
         json_schema_extra = {
             "example": {
                 "alertId": "ALT-001",
@@ -64,3 +80,6 @@ class AlertSummary(BaseModel):
     severity: AlertSeverity
     title: str
     reasonShort: str
+    
+    class Config:
+        frozen = True  # Read-only listing view
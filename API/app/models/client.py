@@ -1,8 +1,8 @@
 """
 Client data models
 """
-from pydantic import BaseModel, Field
-from typing import Optional, Literal
+from pydantic import BaseModel, Field, PrivateAttr
+from typing import Optional, Dict, Any
 
 
 class ClientSuitabilityProfile(BaseModel):
@@ -35,6 +35,9 @@ class Client(BaseModel):
     """Client basic information"""
     clientAccountNumber: str = Field(..., description="Client account number (3-6-3 format)")
     clientName: str = Field(..., description="Client full name")
+    
+    class Config:
+        frozen = True  # Identity fields; suitability updates only touch the profile
 
 
 class ClientWithSuitability(BaseModel):
@@ -42,37 +45,48 @@ class ClientWithSuitability(BaseModel):
     client: Client
     clientSuitabilityProfile: ClientSuitabilityProfile
     
+    # Memoized to_frontend_format() output - reset when the profile is updated
+    _frontend_cache: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+    
+    def invalidate_frontend_cache(self):
+        """Drop the memoized frontend format after a mutation"""
+        self._frontend_cache = None
+    
     def to_frontend_format(self):
         """Transform to frontend-expected format"""
+        if self._frontend_cache is None:
+            self._frontend_cache = self._build_frontend_format()
+        return self._frontend_cache
+    
+    def _build_frontend_format(self) -> Dict[str, Any]:
+        """Build the frontend-expected dict from the current profile"""
+        account_number = self.client.clientAccountNumber
+        name_parts = self.client.clientName.split()
+        profile = self.clientSuitabilityProfile
+        
+        # Both keys are read by the frontend - share one dict rather than building it twice
+        suitability = {
+            "riskTolerance": profile.riskTolerance,
+            "primaryObjective": profile.primaryObjective,
+            "secondaryObjective": profile.secondaryObjective,
+            "currentIncomeNeed": profile.currentIncomeNeed,
+            "lifeStage": profile.lifeStage,
+            "liquidityImportance": profile.liquidityImportance,
+            "lastUpdated": "2026-02-15T10:30:00Z",
+            "updatedBy": "System"
+        }
+        
         return {
-            "clientId": self.client.clientAccountNumber,
-            "clientAccountNumber": self.client.clientAccountNumber,
-            "accountNumber": self.client.clientAccountNumber,
+            "clientId": account_number,
+            "clientAccountNumber": account_number,
+            "accountNumber": account_number,
             "name": self.client.clientName,
-            "firstName": self.client.clientName.split()[0] if self.client.clientName else "",
-            "lastName": " ".join(self.client.clientName.split()[1:]) if len(self.client.clientName.split()) > 1 else "",
-            "email": f"{self.client.clientAccountNumber.lower().replace('-', '')}@example.com",
+            "firstName": name_parts[0] if name_parts else "",
+            "lastName": " ".join(name_parts[1:]),
+            "email": f"{account_number.lower().replace('-', '')}@example.com",
             "phone": "(555) 123-4567",
-            "suitability": {
-                "riskTolerance": self.clientSuitabilityProfile.riskTolerance,
-                "primaryObjective": self.clientSuitabilityProfile.primaryObjective,
-                "secondaryObjective": self.clientSuitabilityProfile.secondaryObjective,
-                "currentIncomeNeed": self.clientSuitabilityProfile.currentIncomeNeed,
-                "lifeStage": self.clientSuitabilityProfile.lifeStage,
-                "liquidityImportance": self.clientSuitabilityProfile.liquidityImportance,
-                "lastUpdated": "2026-02-15T10:30:00Z",
-                "updatedBy": "System"
-            },
-            "suitabilityProfile": {
-                "riskTolerance": self.clientSuitabilityProfile.riskTolerance,
-                "primaryObjective": self.clientSuitabilityProfile.primaryObjective,
-                "secondaryObjective": self.clientSuitabilityProfile.secondaryObjective,
-                "currentIncomeNeed": self.clientSuitabilityProfile.currentIncomeNeed,
-                "lifeStage": self.clientSuitabilityProfile.lifeStage,
-                "liquidityImportance": self.clientSuitabilityProfile.liquidityImportance,
-                "lastUpdated": "2026-02-15T10:30:00Z",
-                "updatedBy": "System"
-            }
+            "suitability": suitability,
+            "suitabilityProfile": suitability
         }
 
 
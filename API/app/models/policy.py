@@ -1,10 +1,18 @@
 """
 Policy data models
 """
-from pydantic import BaseModel, Field
-from typing import List, Optional
-from decimal import Decimal
-from app.models.alert import Alert, AlertSummary
+from pydantic import BaseModel, Field, PrivateAttr
+from typing import List, Optional, Any, Dict, Tuple
+from datetime import date
+from app.models.alert import Alert, AlertSummary, AlertSeverity
+
+
+# Position of each severity in Policy.severity_counts
+_SEVERITY_INDEX: Dict[AlertSeverity, int] = {
+    AlertSeverity.HIGH: 0,
+    AlertSeverity.MEDIUM: 1,
+    AlertSeverity.LOW: 2
+}
 
 
 class Beneficiary(BaseModel):
@@ -20,6 +28,9 @@ class TaxWithholding(BaseModel):
     """Tax withholding elections"""
     federal: Optional[float] = Field(None, description="Federal withholding percentage")
     state: Optional[float] = Field(None, description="State withholding percentage")
+    
+    class Config:
+        frozen = True
 
 
 class ContactInfo(BaseModel):
@@ -27,6 +38,9 @@ class ContactInfo(BaseModel):
     address: Optional[str] = Field(None, description="Mailing address")
     email: Optional[str] = Field(None, description="Email address")
     phone: Optional[str] = Field(None, description="Phone number")
+    
+    class Config:
+        frozen = True
 
 
 class NonFinancialData(BaseModel):
@@ -45,6 +59,9 @@ class PolicyFees(BaseModel):
     """Policy fee structure"""
     m_e_fee: float = Field(default=0.0, description="Mortality & Expense fee")
     riderFee: float = Field(default=0.0, description="Rider fee")
+    
+    class Config:
+        frozen = True
 
 
 class Policy(BaseModel):
@@ -69,6 +86,138 @@ class Policy(BaseModel):
     nonFinancialData: Optional[NonFinancialData] = Field(None, description="Non-financial data (beneficiaries, contact, tax)")
     notes: str = Field(default="", description="Additional notes")
     alerts: List[Alert] = Field(default_factory=list, description="Active alerts for this policy")
+    
+    # surrenderEndDate parsed once at load time (None if missing or malformed)
+    _surrender_end_date: Optional[date] = PrivateAttr(default=None)
+    # Static PolicyDetail fields, built once (see precompute_derived)
+    _detail_fields: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+    # PolicySummary fields (with alert summaries) for listing views
+    _summary: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+    # (HIGH, MEDIUM, LOW) alert counts
+    _severity_counts: Tuple[int, int, int] = PrivateAttr(default=(0, 0, 0))
+    # reasonShort of the first three alerts (replacement reasons)
+    _top_reasons: List[str] = PrivateAttr(default_factory=list)
+    
+    def model_post_init(self, __context: Any) -> None:
+        """Parse derived fields once when the policy is loaded"""
+        if self.surrenderEndDate:
+            try:
+                self._surrender_end_date = date.fromisoformat(self.surrenderEndDate)
+            except ValueError:
+                self._surrender_end_date = None
+    
+    @property
+    def surrender_end_date(self) -> Optional[date]:
+        """Surrender schedule end date as a date object"""
+        return self._surrender_end_date
+    
+    def surrender_values(self, today: date) -> Tuple[Optional[float], Optional[float]]:
+        """
+        Current surrender charge (%) and cash surrender value as of `today`.
+        Charge assumes max 10% at issue, decreasing linearly to 0 at surrender end.
+        """
+        if not (self.accountValue and self.surrenderScheduleYears and self._surrender_end_date):
+            return None, self.accountValue
+        
+        days_until_end = (self._surrender_end_date - today).days
+        if days_until_end <= 0:
+            return 0, self.accountValue
+        
+        charge = max(0, 10 * (days_until_end / (self.surrenderScheduleYears * 365)))
+        return charge, self.accountValue * (1 - charge / 100)
+    
+    def precompute_derived(self) -> None:
+        """
+        Build the PolicyDetail and PolicySummary fields that only change when the policy does.
+        Call again after mutating the policy (the data store does this in update_policy).
+        """
+        # Calculate death benefit (typically 100% - 150% of account value)
+        death_benefit = self.accountValue * 1.0 if self.accountValue else None
+        
+        # Convert riderType to riders array
+        has_rider_type = bool(self.riderType) and self.riderType.lower() != 'none'
+        riders = [self.riderType] if has_rider_type else []
+        
+        # Add income rider if applicable (riders holds at most riderType at this point)
+        if self.incomeActivated or self.incomeBase:
+            income_rider = f"Income Rider (${self.incomeBase:,.0f})" if self.incomeBase else "Income Rider"
+            if not has_rider_type or self.riderType != income_rider:
+                riders.append(income_rider)
+        
+        self._detail_fields = {
+            "policyId": self.policyId,
+            "clientAccountNumber": self.clientAccountNumber,
+            "carrier": self.carrier,
+            "productType": self.productType,
+            "productName": self.policyLabel or self.productType,  # Derived from policyLabel
+            "issueDate": self.issueDate,
+            "renewalDate": None,  # Not in source data
+            "renewalDays": self.renewalDays,
+            "daysToRenewal": self.renewalDays,  # Alias
+            "contractValue": self.accountValue,  # Map accountValue to contractValue
+            "accountValue": self.accountValue,
+            "deathBenefit": death_benefit,
+            "surrenderEndDate": self.surrenderEndDate,
+            "currentCapRate": self.currentCapRate,
+            "projectedRenewalRate": self.renewalCapRate,
+            "riders": riders,
+            "annualFee": None,  # Not in source data
+            "riderFee": self.fees.riderFee if self.fees else None,
+            "meFee": self.fees.m_e_fee if self.fees else None,
+            "adminFee": None  # Not in source data
+        }
+        
+        # Single pass over the alerts: summaries and severity counts together
+        alert_summaries = []
+        counts = [0, 0, 0]
+        for alert in self.alerts:
+            alert_summaries.append(alert.summary)
+            index = _SEVERITY_INDEX.get(alert.severity)
+            if index is not None:
+                counts[index] += 1
+        self._severity_counts = tuple(counts)
+        self._top_reasons = [alert.reasonShort for alert in self.alerts[:3]]
+        
+        self._summary = {
+            "policyId": self.policyId,
+            "clientAccountNumber": self.clientAccountNumber,
+            "policyLabel": self.policyLabel,
+            "carrier": self.carrier,
+            "productType": self.productType,
+            "accountValue": self.accountValue,
+            "renewalDays": self.renewalDays,
+            "currentCapRate": self.currentCapRate,
+            "renewalCapRate": self.renewalCapRate,
+            "alerts": alert_summaries
+        }
+    
+    @property
+    def detail_fields(self) -> Dict[str, Any]:
+        """Static PolicyDetail fields (computed on first access if not precomputed)"""
+        if self._detail_fields is None:
+            self.precompute_derived()
+        return self._detail_fields
+    
+    @property
+    def severity_counts(self) -> Tuple[int, int, int]:
+        """Alert counts by severity as (HIGH, MEDIUM, LOW)"""
+        if self._summary is None:
+            self.precompute_derived()
+        return self._severity_counts
+    
+    @property
+    def top_reasons(self) -> List[str]:
+        """Short reasons of the first three alerts - treat as read-only"""
+        if self._summary is None:
+            self.precompute_derived()
+        return self._top_reasons
+    
+    @property
+    def summary(self) -> Dict[str, Any]:
+        """PolicySummary fields for listing views - treat as read-only"""
+        if self._summary is None:
+            self.precompute_derived()
+        return self._summary
 
 
 class PolicySummary(BaseModel):
@@ -83,6 +232,9 @@ class PolicySummary(BaseModel):
     currentCapRate: Optional[float] = None
     renewalCapRate: Optional[float] = None
     alerts: List[AlertSummary] = Field(default_factory=list, description="Alert summaries")
+    
+    class Config:
+        frozen = True  # Read-only listing view
 
 
 class ClientPoliciesGroup(BaseModel):
@@ -94,6 +246,9 @@ class ClientPoliciesGroup(BaseModel):
     highSeverityCount: int = Field(default=0, description="Count of HIGH severity alerts")
     mediumSeverityCount: int = Field(default=0, description="Count of MEDIUM severity alerts")
     lowSeverityCount: int = Field(default=0, description="Count of LOW severity alerts")
+    
+    class Config:
+        frozen = True  # Read-only listing view
 
 
 class PolicyDetail(BaseModel):
@@ -75,6 +75,9 @@ class PortfolioSummary(BaseModel):
     totalEquities: float = Field(..., description="Total equity positions across all accounts")
     totalFixedIncome: float = Field(..., description="Total fixed income positions")
     totalAnnuities: float = Field(default=0.0, description="Total annuity positions")
+    
+    class Config:
+        frozen = True
 
 
 class ClientPosition(BaseModel):
@@ -28,6 +28,9 @@ class ProductFees(BaseModel):
     m_e_fee: float = Field(default=0.0, description="Mortality & Expense fee")
     administrativeFee: float = Field(default=0.0, description="Administrative fee")
     fundExpenses: Optional[float] = Field(None, description="Average fund expenses (VA only)")
+    
+    class Config:
+        frozen = True
 
 
 class SurrenderSchedule(BaseModel):
@@ -60,11 +60,16 @@ For complete documentation, see:
 
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 """
-from pydantic import BaseModel, Field, validator
-from typing import Optional, List, Literal, Dict, Any
-from datetime import datetime
+from pydantic import AfterValidator, BaseModel, Field
+from typing import Annotated, Optional, List, Literal, Dict, Any
 from decimal import Decimal
 from enum import Enum
+import sys
+
+
+# Low-cardinality labels (carriers, states, profile ranges) repeated across stored
+# transactions - interned so payloads share one string object per distinct value
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
 
 
 class TransactionType(str, Enum):
@@ -108,10 +113,10 @@ class TransactionStatus(str, Enum):
 class CurrentPolicyInfo(BaseModel):
     """Information about the policy being replaced"""
     policyNumber: str = Field(..., description="Current policy/contract number")
-    carrier: str = Field(..., description="Current carrier name")
+    carrier: InternedStr = Field(..., description="Current carrier name")
     carrierCode: Optional[str] = Field(default=None, description="Carrier NAIC code")
     productName: str = Field(..., description="Current product name")
-    productType: str = Field(..., description="FIA, VA, Fixed, SPIA, DIA")
+    productType: InternedStr = Field(..., description="FIA, VA, Fixed, SPIA, DIA")
     
     # Financial details
     accountValue: Decimal = Field(..., description="Current account/cash value")
@@ -130,7 +135,7 @@ class CurrentPolicyInfo(BaseModel):
         ..., 
         description="IRA/Qualified or Non-Qualified"
     )
-    qualificationType: Optional[str] = Field(
+    qualificationType: Optional[InternedStr] = Field(
         default=None, 
         description="Traditional IRA, Roth IRA, SEP, SIMPLE, 403(b), etc."
     )
@@ -154,6 +159,9 @@ class CurrentPolicyInfo(BaseModel):
         default=None,
         description="Justification if incurring surrender charges"
     )
+    
+    class Config:
+        frozen = True
 
 
 # ============================================================================
@@ -163,10 +171,10 @@ class CurrentPolicyInfo(BaseModel):
 class NewProductSelection(BaseModel):
     """Selected new product details"""
     productId: str = Field(..., description="Product ID from catalog")
-    carrier: str = Field(..., description="New carrier name")
+    carrier: InternedStr = Field(..., description="New carrier name")
     carrierCode: Optional[str] = Field(default=None, description="Carrier NAIC code")
     productName: str = Field(..., description="New product name")
-    productType: str = Field(..., description="FIA, VA, Fixed, SPIA, DIA")
+    productType: InternedStr = Field(..., description="FIA, VA, Fixed, SPIA, DIA")
     
     # Premium allocation
     initialPremium: Decimal = Field(..., description="Total initial premium")
@@ -188,6 +196,9 @@ class NewProductSelection(BaseModel):
     # Bonus (if applicable)
     bonusRate: Optional[float] = Field(default=None, description="Premium bonus rate")
     bonusAmount: Optional[Decimal] = Field(default=None, description="Calculated bonus amount")
+    
+    class Config:
+        frozen = True
 
 
 # ============================================================================
@@ -205,26 +216,29 @@ class ClientInfo(BaseModel):
     dateOfBirth: str = Field(..., description="Date of birth (YYYY-MM-DD)")
     age: int = Field(..., description="Current age")
     gender: Literal["M", "F", "X"] = Field(..., description="Gender")
-    citizenship: str = Field(default="USA", description="Citizenship")
+    citizenship: InternedStr = Field(default="USA", description="Citizenship")
     
     # Contact
     address: str = Field(..., description="Street address")
     city: str = Field(..., description="City")
-    state: str = Field(..., description="State code (2-letter)")
+    state: InternedStr = Field(..., description="State code (2-letter)")
     zipCode: str = Field(..., description="ZIP code")
     phone: str = Field(..., description="Primary phone number")
     email: str = Field(..., description="Email address")
     
     # Financial profile
-    annualIncome: str = Field(..., description="Annual income range")
-    netWorth: str = Field(..., description="Net worth range")
-    liquidNetWorth: str = Field(..., description="Liquid net worth range")
-    taxBracket: str = Field(..., description="Estimated tax bracket")
+    annualIncome: InternedStr = Field(..., description="Annual income range")
+    netWorth: InternedStr = Field(..., description="Net worth range")
+    liquidNetWorth: InternedStr = Field(..., description="Liquid net worth range")
+    taxBracket: InternedStr = Field(..., description="Estimated tax bracket")
     
     # Employment
-    employmentStatus: str = Field(..., description="Employed, Retired, Self-Employed, etc.")
+    employmentStatus: InternedStr = Field(..., description="Employed, Retired, Self-Employed, etc.")
     occupation: Optional[str] = Field(default=None, description="Occupation")
     employer: Optional[str] = Field(default=None, description="Employer name")
+    
+    class Config:
+        frozen = True
 
 
 class AnnuitantInfo(BaseModel):
@@ -236,7 +250,10 @@ class AnnuitantInfo(BaseModel):
     ssn: Optional[str] = Field(default=None, description="Annuitant SSN")
     dateOfBirth: Optional[str] = Field(default=None, description="Annuitant DOB (YYYY-MM-DD)")
     gender: Optional[Literal["M", "F", "X"]] = Field(default=None, description="Gender")
-    relationship: Optional[str] = Field(default=None, description="Relationship to owner")
+    relationship: Optional[InternedStr] = Field(default=None, description="Relationship to owner")
+    
+    class Config:
+        frozen = True
 
 
 # ============================================================================
@@ -250,7 +267,7 @@ class BeneficiaryDesignation(BaseModel):
     middleName: Optional[str] = Field(default=None, description="Middle name")
     lastName: str = Field(..., description="Last name")
     suffix: Optional[str] = Field(default=None, description="Suffix")
-    relationship: str = Field(..., description="Relationship to owner")
+    relationship: InternedStr = Field(..., description="Relationship to owner")
     ssn: Optional[str] = Field(default=None, description="SSN/Tax ID")
     dateOfBirth: Optional[str] = Field(default=None, description="Date of birth (YYYY-MM-DD)")
     allocationPercent: float = Field(..., description="Allocation percentage", ge=0, le=100)
@@ -258,10 +275,13 @@ class BeneficiaryDesignation(BaseModel):
     # Contact (for notification)
     address: Optional[str] = Field(default=None, description="Street address")
     city: Optional[str] = Field(default=None, description="City")
-    state: Optional[str] = Field(default=None, description="State")
+    state: Optional[InternedStr] = Field(default=None, description="State")
     zipCode: Optional[str] = Field(default=None, description="ZIP code")
     phone: Optional[str] = Field(default=None, description="Phone number")
     email: Optional[str] = Field(default=None, description="Email address")
+    
+    class Config:
+        frozen = True
 
 
 # ============================================================================
@@ -275,13 +295,13 @@ class SuitabilityProfile(BaseModel):
         ..., 
         description="Risk tolerance"
     )
-    investmentObjective: str = Field(..., description="Growth, Income, Preservation, etc.")
-    investmentExperience: str = Field(..., description="Investment experience level")
-    investmentHorizon: str = Field(..., description="Short (0-3y), Medium (3-7y), Long (7+y)")
+    investmentObjective: InternedStr = Field(..., description="Growth, Income, Preservation, etc.")
+    investmentExperience: InternedStr = Field(..., description="Investment experience level")
+    investmentHorizon: InternedStr = Field(..., description="Short (0-3y), Medium (3-7y), Long (7+y)")
     
     # Liquidity & time horizon
     liquidityNeeds: Literal["High", "Medium", "Low"] = Field(..., description="Liquidity needs")
-    timeHorizon: str = Field(..., description="Expected holding period")
+    timeHorizon: InternedStr = Field(..., description="Expected holding period")
     surrenderChargeAcceptance: bool = Field(..., description="Understands surrender charges")
     
     # Income needs
@@ -297,6 +317,9 @@ class SuitabilityProfile(BaseModel):
     understandsReplacement: bool = Field(..., description="Understands replacement implications")
     comparedAlternatives: bool = Field(..., description="Compared multiple alternatives")
     reviewedSurrenderCharges: bool = Field(..., description="Reviewed surrender charges")
+    
+    class Config:
+        frozen = True
 
 
 class ComplianceChecklist(BaseModel):
@@ -330,6 +353,9 @@ class ComplianceChecklist(BaseModel):
     # Special situations
     seniorProtectionApplies: bool = Field(default=False, description="Senior protection rules apply")
     longerFreeLookApplies: bool = Field(default=False, description="Extended free look applies")
+    
+    class Config:
+        frozen = True
 
 
 # ============================================================================
@@ -346,7 +372,7 @@ class AdvisorInfo(BaseModel):
     
     # Licensing
     licenseNumber: str = Field(..., description="Insurance license number")
-    licenseState: str = Field(..., description="License state")
+    licenseState: InternedStr = Field(..., description="License state")
     
     # Carrier appointments
     hasCarrierAppointment: bool = Field(..., description="Has appointment with new carrier")
@@ -357,10 +383,13 @@ class AdvisorInfo(BaseModel):
     completedCE: bool = Field(default=True, description="CE requirements current")
     
     # Firm information
-    firmName: str = Field(..., description="Advisory firm/agency name")
+    firmName: InternedStr = Field(..., description="Advisory firm/agency name")
     firmAddress: Optional[str] = Field(default=None, description="Firm address")
     bdName: Optional[str] = Field(default=None, description="Broker-dealer name (if applicable)")
     bdCRD: Optional[str] = Field(default=None, description="BD CRD number")
+    
+    class Config:
+        frozen = True
 
 
 # ============================================================================
@@ -380,6 +409,9 @@ class TaxWithholdingElections(BaseModel):
     # W-9 certification
     w9OnFile: bool = Field(..., description="W-9 form on file")
     w9Date: Optional[str] = Field(default=None, description="W-9 signature date")
+    
+    class Config:
+        frozen = True
 
 
 # ============================================================================
@@ -448,7 +480,7 @@ class ReplacementTransactionPayload(BaseModel):
         ...,
         description="Qualified or non-qualified money"
     )
-    qualificationType: Optional[str] = Field(
+    qualificationType: Optional[InternedStr] = Field(
         default=None,
         description="IRA type: Traditional, Roth, SEP, SIMPLE, 403(b), etc."
     )
@@ -487,6 +519,7 @@ class ReplacementTransactionPayload(BaseModel):
     )
     
     class Config:
+        frozen = True  # Stored as submitted - transactions keep the parsed payload
         json_schema_extra = {
             "example": {
                 "transactionId": "TXN-2026-00001",
@@ -532,6 +565,9 @@ class TransactionSubmissionResponse(BaseModel):
     estimatedCompletionDate: Optional[str] = Field(None, description="Estimated completion")
     errors: List[str] = Field(default_factory=list, description="Any validation errors")
     warnings: List[str] = Field(default_factory=list, description="Any warnings")
+    
+    class Config:
+        frozen = True
 
 
 class TransactionValidationResponse(BaseModel):
@@ -541,3 +577,6 @@ class TransactionValidationResponse(BaseModel):
     warnings: List[str] = Field(default_factory=list, description="Validation warnings")
     missingFields: List[str] = Field(default_factory=list, description="Required fields missing")
     complianceFlags: List[str] = Field(default_factory=list, description="Compliance issues")
+    
+    class Config:
+        frozen = True
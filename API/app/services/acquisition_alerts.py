@@ -215,7 +215,7 @@ class AcquisitionAlertGenerator:
         cd_positions = []
         for pos in positions.get("positions", []):
             if pos.get("assetClass") == "FIXED_INCOME" and pos.get("maturityDate"):
-                maturity_date = datetime.strptime(pos["maturityDate"], "%Y-%m-%d")
+                maturity_date = datetime.fromisoformat(pos["maturityDate"])
                 days_to_maturity = (maturity_date - self.current_date).days
                 
                 if 0 < days_to_maturity <= 90:
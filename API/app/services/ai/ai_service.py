@@ -1,13 +1,44 @@
 """
 AI Service - orchestrates AI provider usage
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator, Mapping, Tuple
+from types import MappingProxyType
 from app.services.ai.base_provider import AIProvider, ChatMessage, ChatResponse
 from app.services.ai.openai_provider import OpenAIProvider
 from app.services.ai.mock_provider import MockAIProvider
+from app.services.ai.batching import BatchingQueue
 from app.config import settings
 
 
+# Quick action prompts per alert type, shown in the AI Copilot drawer UI
+_QUICK_ACTIONS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    "REPLACEMENT": (
+        "Explain why this alert was triggered",
+        "Compare current policy to alternatives",
+        "Draft best-interest summary",
+        "Analyze suitability changes"
+    ),
+    "INCOME_ACTIVATION": (
+        "Explain timing tradeoffs",
+        "Draft client explanation",
+        "Calculate break-even scenarios",
+        "Compare now vs. delayed income"
+    ),
+    "SUITABILITY_DRIFT": (
+        "Explain review rationale",
+        "Draft suitability review note",
+        "Summarize profile changes",
+        "Document assessment"
+    )
+})
+
+_DEFAULT_QUICK_ACTIONS: Tuple[str, ...] = (
+    "Explain this alert",
+    "Draft review note",
+    "Provide guidance"
+)
+
+
 class AIService:
     """
     Main AI service that handles provider selection and chat operations.
@@ -18,6 +49,13 @@ class AIService:
         """Initialize AI service with configured provider"""
         self._provider: Optional[AIProvider] = None
         self._initialize_provider()
+        self._batcher: Optional[BatchingQueue] = None
+        if settings.AI_BATCH_MAX > 1:
+            self._batcher = BatchingQueue(
+                self._provider.abatch_chat,
+                max_batch=settings.AI_BATCH_MAX,
+                max_wait_ms=settings.AI_BATCH_MAX_WAIT_MS
+            )
     
     def _initialize_provider(self):
         """Initialize the AI provider based on configuration"""
@@ -78,47 +116,49 @@ class AIService:
         # Add current user message
         messages.append(ChatMessage(role="user", content=user_message))
         
-        # Get response from provider
-        response = await self._provider.chat(
+        request = {
+            "messages": messages,
+            "context": context,
+            "temperature": temperature,
+            "max_tokens": 1000
+        }
+        
+        # Concurrent chats are grouped into a single provider batch
+        if self._batcher:
+            return await self._batcher.submit(request)
+        
+        return await self._provider.chat(**request)
+    
+    def stream_chat(
+        self,
+        user_message: str,
+        context: Optional[Dict[str, Any]] = None,
+        conversation_history: Optional[List[ChatMessage]] = None,
+        temperature: float = 0.7
+    ) -> AsyncIterator[str]:
+        """
+        Stream a chat response from the AI provider as text chunks.
+        Streams bypass the batching queue - each holds its own provider connection.
+        """
+        if not self._provider:
+            raise RuntimeError("AI provider not initialized")
+        
+        messages = conversation_history.copy() if conversation_history else []
+        messages.append(ChatMessage(role="user", content=user_message))
+        
+        return self._provider.astream(
             messages=messages,
             context=context,
             temperature=temperature,
             max_tokens=1000
         )
-        
-        return response
     
-    def get_quick_actions(self, alert_type: str) -> List[str]:
+    def get_quick_actions(self, alert_type: str) -> Tuple[str, ...]:
         """
         Get suggested quick actions based on alert type.
         These are displayed in the AI Copilot drawer UI.
         """
-        quick_actions = {
-            "REPLACEMENT": [
-                "Explain why this alert was triggered",
-                "Compare current policy to alternatives",
-                "Draft best-interest summary",
-                "Analyze suitability changes"
-            ],
-            "INCOME_ACTIVATION": [
-                "Explain timing tradeoffs",
-                "Draft client explanation",
-                "Calculate break-even scenarios",
-                "Compare now vs. delayed income"
-            ],
-            "SUITABILITY_DRIFT": [
-                "Explain review rationale",
-                "Draft suitability review note",
-                "Summarize profile changes",
-                "Document assessment"
-            ]
-        }
-        
-        return quick_actions.get(alert_type, [
-            "Explain this alert",
-            "Draft review note",
-            "Provide guidance"
-        ])
+        return _QUICK_ACTIONS.get(alert_type, _DEFAULT_QUICK_ACTIONS)
     
     def get_provider_info(self) -> Dict[str, str]:
         """Get information about the current AI provider"""
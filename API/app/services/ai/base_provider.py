@@ -2,8 +2,9 @@
 AI Provider base interface
 Abstract base class for AI provider implementations
 """
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator
 from pydantic import BaseModel
 
 
@@ -50,6 +51,40 @@ class AIProvider(ABC):
         """
         pass
     
+    async def astream(
+        self,
+        messages: List[ChatMessage],
+        context: Optional[Dict[str, Any]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 1000
+    ) -> AsyncIterator[str]:
+        """
+        Stream the response text as it is generated.
+        
+        Providers that support token streaming should override this; the default
+        yields the complete chat() message as a single chunk.
+        """
+        response = await self.chat(
+            messages=messages,
+            context=context,
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+        yield response.message
+    
+    async def abatch_chat(self, requests: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Send several chat requests in one call.
+        
+        Each request holds the keyword arguments for chat(). Providers with a native
+        batch endpoint should override this; the default runs the calls concurrently.
+        Failed requests come back as exception instances in their slot.
+        """
+        return await asyncio.gather(
+            *(self.chat(**request) for request in requests),
+            return_exceptions=True
+        )
+    
     @abstractmethod
     def get_provider_name(self) -> str:
         """Return the provider name (e.g., 'openai', 'anthropic')"""
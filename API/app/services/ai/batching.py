@@ -0,0 +1,87 @@
+"""
+Micro-batching queue for AI provider calls
+Groups concurrent chat requests into a single provider batch call
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional, Set, Tuple
+
+
+BatchHandler = Callable[[List[Any]], Awaitable[List[Any]]]
+
+
+class BatchingQueue:
+    """
+    Collects requests for up to `max_wait_ms` (or until `max_batch` are queued)
+    and hands them to `handler` as one list. Each caller awaits its own result.
+    """
+
+    def __init__(self, handler: BatchHandler, max_batch: int = 16, max_wait_ms: int = 20):
+        self._handler = handler
+        self._max_batch = max(1, max_batch)
+        self._max_wait = max(0, max_wait_ms) / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._inflight: Set[asyncio.Task] = set()
+
+    async def submit(self, request: Any) -> Any:
+        """Queue a request and wait for its result from the next batch"""
+        self._ensure_worker()
+        future = self._loop.create_future()
+        await self._queue.put((future, request))
+        return await future
+
+    def _ensure_worker(self):
+        """Start the flush loop on the running event loop (lazily, once per loop)"""
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done() or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._flush_loop())
+
+    async def _flush_loop(self):
+        """Wait for the first request, then collect more until the window closes or the batch is full"""
+        while True:
+            batch = [await self._queue.get()]
+            deadline = self._loop.time() + self._max_wait
+
+            while len(batch) < self._max_batch:
+                timeout = deadline - self._loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # Dispatch without blocking the next collection window
+            task = self._loop.create_task(self._dispatch(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _dispatch(self, batch: List[Tuple[asyncio.Future, Any]]):
+        """Run the handler for one batch and resolve each caller's future"""
+        futures = [future for future, _ in batch]
+        try:
+            results = await self._handler([request for _, request in batch])
+            if len(results) != len(futures):
+                raise RuntimeError(
+                    f"Batch handler returned {len(results)} results for {len(futures)} requests"
+                )
+            
+            for future, result in zip(futures, results):
+                if future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+        except Exception as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            # Cancellation (or any other BaseException) must not leave callers waiting forever
+            for future in futures:
+                if not future.done():
+                    future.set_exception(RuntimeError("Batch dispatch was interrupted"))
@@ -1,8 +1,9 @@
 """
 Mock AI provider for testing and demo purposes
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator
 import random
+import re
 from app.services.ai.base_provider import AIProvider, ChatMessage, ChatResponse
 
 
@@ -186,6 +187,20 @@ class MockAIProvider(AIProvider):
             tokensUsed=len(response_text) // 4  # Rough token estimate
         )
     
+    async def astream(
+        self,
+        messages: List[ChatMessage],
+        context: Optional[Dict[str, Any]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 1000
+    ) -> AsyncIterator[str]:
+        """
+        Stream the mock response word by word to mimic token streaming.
+        """
+        response = await self.chat(messages, context, temperature, max_tokens)
+        for token in re.findall(r"\S+\s*", response.message):
+            yield token
+    
     def get_provider_name(self) -> str:
         return "mock"
     
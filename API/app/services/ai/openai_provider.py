@@ -1,7 +1,7 @@
 """
 OpenAI provider implementation
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator
 import json
 from app.services.ai.base_provider import AIProvider, ChatMessage, ChatResponse
 from app.config import settings
@@ -52,16 +52,7 @@ class OpenAIProvider(AIProvider):
         """
         Send chat request to OpenAI.
         """
-        # Convert messages to OpenAI format
-        openai_messages = [
-            {"role": msg.role, "content": msg.content}
-            for msg in messages
-        ]
-        
-        # Add system context if provided
-        if context and not any(msg.role == "system" for msg in messages):
-            system_prompt = self._build_system_prompt(context)
-            openai_messages.insert(0, {"role": "system", "content": system_prompt})
+        openai_messages = self._build_messages(messages, context)
         
         # Call OpenAI API
         try:
@@ -89,9 +80,55 @@ class OpenAIProvider(AIProvider):
         except Exception as e:
             raise RuntimeError(f"OpenAI API error: {str(e)}")
     
+    async def astream(
+        self,
+        messages: List[ChatMessage],
+        context: Optional[Dict[str, Any]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 1000
+    ) -> AsyncIterator[str]:
+        """
+        Stream chat response deltas from OpenAI.
+        """
+        openai_messages = self._build_messages(messages, context)
+        
+        try:
+            stream = await self.client.chat.completions.create(
+                model=self.model,
+                messages=openai_messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True
+            )
+            
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        
+        except Exception as e:
+            raise RuntimeError(f"OpenAI API error: {str(e)}")
+    
     def get_provider_name(self) -> str:
         return "openai"
     
+    def _build_messages(
+        self,
+        messages: List[ChatMessage],
+        context: Optional[Dict[str, Any]]
+    ) -> List[Dict[str, str]]:
+        """Convert messages to OpenAI format, prepending a system prompt built from context"""
+        openai_messages = [
+            {"role": msg.role, "content": msg.content}
+            for msg in messages
+        ]
+        
+        # Add system context if provided
+        if context and not any(msg.role == "system" for msg in messages):
+            system_prompt = self._build_system_prompt(context)
+            openai_messages.insert(0, {"role": "system", "content": system_prompt})
+        
+        return openai_messages
+    
     def _build_system_prompt(self, context: Dict[str, Any]) -> str:
         """Build system prompt from context"""
         prompt_parts = [
@@ -2,6 +2,7 @@
 Data store service - loads and manages JSON data files
 """
 import json
+import sys
 from typing import List, Optional, Dict
 from pathlib import Path
 from app.config import settings
@@ -11,14 +12,41 @@ from app.models.product import Product
 from app.models.alert import AlertSeverity
 
 
+# Low-cardinality string fields shared by many rows - interned at load so
+# every row references one string object per distinct value
+_INTERNED_POLICY_FIELDS = ("carrier", "productType", "applicationState", "riderType")
+_INTERNED_PRODUCT_FIELDS = ("carrier", "productType")
+
+
+def _intern_fields(rows: List[Dict], fields: tuple) -> List[Dict]:
+    """Intern the given string fields of raw JSON rows in place"""
+    for row in rows:
+        for field in fields:
+            value = row.get(field)
+            if type(value) is str:
+                row[field] = sys.intern(value)
+    return rows
+
+
 class DataStore:
     """Data store for managing policy and client data from JSON files"""
     
     def __init__(self):
         self._clients: List[ClientWithSuitability] = []
+        self._clients_by_account: Dict[str, ClientWithSuitability] = {}
+        self._client_name_by_account: Dict[str, str] = {}
         self._products: List[Product] = []
+        self._products_by_id: Dict[str, Product] = {}
+        self._products_by_type: Dict[str, List[Product]] = {}
+        self._products_by_carrier: Dict[str, List[Product]] = {}  # Keyed by lowercased carrier
         self._policies: List[Policy] = []
+        self._policies_by_id: Dict[str, Policy] = {}
+        self._policies_by_client: Dict[str, List[Policy]] = {}
         self._acquisition_alerts: List[Dict] = []  # Client-level acquisition opportunities
+        self._acquisition_totals: Dict[str, float] = {"totalAlerts": 0, "totalPortfolioValue": 0.0}
+        self._version: int = 0  # Bumped on every mutation so cached responses can be invalidated
+        self._clients_with_policies: Optional[Dict[str, ClientWithSuitability]] = None
+        self._clients_with_policies_version: int = -1
         self._load_data()
     
     def _load_data(self):
@@ -28,6 +56,13 @@ class DataStore:
             with open(settings.CLIENTS_DATA_FILE, 'r', encoding='utf-8') as f:
                 clients_data = json.load(f)
                 self._clients = [ClientWithSuitability(**client) for client in clients_data]
+                # Reversed so the first client wins on a duplicate account (matches a linear scan)
+                self._clients_by_account = {
+                    c.client.clientAccountNumber: c for c in reversed(self._clients)
+                }
+                self._client_name_by_account = {
+                    acct: c.client.clientName for acct, c in self._clients_by_account.items()
+                }
         
         # Load policies
         if settings.POLICIES_DATA_FILE.exists():
@@ -37,51 +72,111 @@ class DataStore:
         # Load products
         if settings.PRODUCTS_DATA_FILE.exists():
             with open(settings.PRODUCTS_DATA_FILE, 'r', encoding='utf-8') as f:
-                products_data = json.load(f)
+                products_data = _intern_fields(json.load(f), _INTERNED_PRODUCT_FIELDS)
                 self._products = [Product(**product) for product in products_data]
-                self._policies = [Policy(**policy) for policy in policies_data]
+                self._policies = [
+                    Policy(**policy)
+                    for policy in _intern_fields(policies_data, _INTERNED_POLICY_FIELDS)
+                ]
+        
+        self._index_products()
+        self._index_policies()
         
         # Load acquisition alerts (client-level portfolio opportunities)
         acquisition_alerts_file = settings.DATA_DIR / "acquisition_alerts_generated.json"
         if acquisition_alerts_file.exists():
             with open(acquisition_alerts_file, 'r', encoding='utf-8') as f:
                 self._acquisition_alerts = json.load(f)
+            # Single pass over the clients for both totals
+            total_alerts = 0
+            total_value = 0.0
+            for client_alerts in self._acquisition_alerts:
+                total_alerts += len(client_alerts.get("alerts", ()))
+                total_value += client_alerts.get("totalPortfolioValue", 0)
+            self._acquisition_totals = {
+                "totalAlerts": total_alerts,
+                "totalPortfolioValue": total_value
+            }
         else:
             print("⚠️  acquisition_alerts_generated.json not found - run batch_alert_generator.py to generate")
     
+    def _index_products(self):
+        """Index the product catalog by ID, type and carrier (catalog order preserved)"""
+        self._products_by_id = {}
+        self._products_by_type = {}
+        self._products_by_carrier = {}
+        by_id = self._products_by_id
+        by_type = self._products_by_type
+        by_carrier = self._products_by_carrier
+        for product in self._products:
+            by_id[product.productId] = product
+            
+            bucket = by_type.get(product.productType)
+            if bucket is None:
+                bucket = by_type[product.productType] = []
+            bucket.append(product)
+            
+            carrier_key = product.carrier.lower()
+            bucket = by_carrier.get(carrier_key)
+            if bucket is None:
+                bucket = by_carrier[carrier_key] = []
+            bucket.append(product)
+    
+    def _index_policies(self):
+        """Index policies by ID and bucket them by client account (insertion order preserved)"""
+        self._policies_by_id = {}
+        self._policies_by_client = {}
+        by_id = self._policies_by_id
+        by_client = self._policies_by_client
+        for policy in self._policies:
+            policy.precompute_derived()
+            by_id[policy.policyId] = policy
+            
+            bucket = by_client.get(policy.clientAccountNumber)
+            if bucket is None:
+                bucket = by_client[policy.clientAccountNumber] = []
+            bucket.append(policy)
+    
+    @property
+    def version(self) -> int:
+        """Data version - changes whenever clients or policies are updated"""
+        return self._version
+    
     def get_all_policies(self) -> List[Policy]:
         """Get all policies"""
         return self._policies
     
     def get_policy_by_id(self, policy_id: str) -> Optional[Policy]:
         """Get a specific policy by ID"""
-        for policy in self._policies:
-            if policy.policyId == policy_id:
-                return policy
-        return None
+        return self._policies_by_id.get(policy_id)
     
     def get_policies_by_client(self, client_account_number: str) -> List[Policy]:
         """Get all policies for a specific client"""
-        return [
-            policy for policy in self._policies 
-            if policy.clientAccountNumber == client_account_number
-        ]
+        return list(self._policies_by_client.get(client_account_number, []))
+    
+    def get_policies_by_client_map(self) -> Dict[str, List[Policy]]:
+        """Get all policies indexed by client account number"""
+        return self._policies_by_client
     
     def get_client(self, client_account_number: str) -> Optional[ClientWithSuitability]:
         """Get client information by account number"""
-        for client in self._clients:
-            if client.client.clientAccountNumber == client_account_number:
-                return client
-        return None
+        return self._clients_by_account.get(client_account_number)
+    
+    def get_client_name(self, client_account_number: str, default: str = "") -> str:
+        """Get a client's display name by account number"""
+        return self._client_name_by_account.get(client_account_number, default)
     
     def get_all_clients(self) -> List[ClientWithSuitability]:
         """Get all clients"""
         return self._clients
     
     def get_clients_with_policies(self) -> Dict[str, ClientWithSuitability]:
-        """Get clients who have policies, indexed by account number"""
-        # Get unique client account numbers from policies
-        client_accounts = set(policy.clientAccountNumber for policy in self._policies)
+        """Get clients who have policies, indexed by account number (memoized per data version)"""
+        if self._clients_with_policies_version == self._version:
+            return self._clients_with_policies
+        
+        # Policies are already bucketed by client account
+        client_accounts = self._policies_by_client
         
         # Build dictionary of clients with policies
         clients_dict = {}
@@ -89,6 +184,8 @@ class DataStore:
             if client.client.clientAccountNumber in client_accounts:
                 clients_dict[client.client.clientAccountNumber] = client
         
+        self._clients_with_policies = clients_dict
+        self._clients_with_policies_version = self._version
         return clients_dict
     
     def update_client_suitability(
@@ -97,14 +194,17 @@ class DataStore:
         updates: dict
     ) -> Optional[ClientWithSuitability]:
         """Update client suitability profile"""
-        for client in self._clients:
-            if client.client.clientAccountNumber == client_account_number:
-                # Update the fields
-                for key, value in updates.items():
-                    if value is not None and hasattr(client.clientSuitabilityProfile, key):
-                        setattr(client.clientSuitabilityProfile, key, value)
-                return client
-        return None
+        client = self._clients_by_account.get(client_account_number)
+        if not client:
+            return None
+        
+        # Update the fields
+        for key, value in updates.items():
+            if value is not None and hasattr(client.clientSuitabilityProfile, key):
+                setattr(client.clientSuitabilityProfile, key, value)
+        client.invalidate_frontend_cache()
+        self._version += 1
+        return client
     
     def get_acquisition_alerts_by_client(self, client_account_number: str) -> List[Dict]:
         """Get acquisition alerts (portfolio opportunities) for a specific client"""
@@ -117,13 +217,38 @@ class DataStore:
         """Get all acquisition alerts across all clients"""
         return self._acquisition_alerts
     
+    def get_acquisition_totals(self) -> Dict[str, float]:
+        """Get alert count and portfolio value totals across all acquisition alerts (computed at load)"""
+        return self._acquisition_totals
+    
     def update_policy(self, updated_policy: Policy) -> Optional[Policy]:
-        """Update a policy in the data store"""
-        for idx, policy in enumerate(self._policies):
-            if policy.policyId == updated_policy.policyId:
-                self._policies[idx] = updated_policy
-                return updated_policy
-        return None
+        """Update a policy in the data store (re-derives and re-indexes only that policy)"""
+        current = self._policies_by_id.get(updated_policy.policyId)
+        if current is None:
+            return None
+        
+        updated_policy.precompute_derived()
+        
+        # Identity scans only - no per-policy recomputation
+        self._policies[next(i for i, p in enumerate(self._policies) if p is current)] = updated_policy
+        self._policies_by_id[updated_policy.policyId] = updated_policy
+        
+        old_account = current.clientAccountNumber
+        new_account = updated_policy.clientAccountNumber
+        old_bucket = self._policies_by_client[old_account]
+        if new_account == old_account:
+            old_bucket[next(i for i, p in enumerate(old_bucket) if p is current)] = updated_policy
+        else:
+            del old_bucket[next(i for i, p in enumerate(old_bucket) if p is current)]
+            if not old_bucket:
+                del self._policies_by_client[old_account]
+            # Rebuild the destination bucket so it keeps the policies' load order
+            self._policies_by_client[new_account] = [
+                p for p in self._policies if p.clientAccountNumber == new_account
+            ]
+        
+        self._version += 1
+        return updated_policy
     
     
     def get_all_products(self) -> List[Product]:
@@ -132,18 +257,16 @@ class DataStore:
     
     def get_product_by_id(self, product_id: str) -> Optional[Product]:
         """Get a specific product by ID"""
-        for product in self._products:
-            if product.productId == product_id:
-                return product
-        return None
+        return self._products_by_id.get(product_id)
     
     def get_products_by_type(self, product_type: str) -> List[Product]:
         """Get products by type (FIA, Fixed, VA)"""
-        return [p for p in self._products if p.productType == product_type]
+        return list(self._products_by_type.get(product_type, []))
     
     def get_products_by_carrier(self, carrier: str) -> List[Product]:
-        """Get products by carrier"""
-        return [p for p in self._products if p.carrier.lower() == carrier.lower()]
+        """Get products by carrier (case-insensitive)"""
+        return list(self._products_by_carrier.get(carrier.lower(), []))
+    
     def count_alerts_by_severity(self, policies: List[Policy]) -> Dict[str, int]:
         """Count alerts by severity across a list of policies"""
         counts = {"HIGH": 0, "MEDIUM": 0, "LOW": 0}
@@ -33,10 +33,10 @@ class ProductMatcher:
         ]
         
         # Score products based on suitability
-        scored_products = []
-        for product in candidates:
-            score = self._score_product(product, current_policy, client)
-            scored_products.append((score, product))
+        scored_products = [
+            (self._score_product(product, current_policy, client), product)
+            for product in candidates
+        ]
         
         # Sort by score (descending)
         scored_products.sort(key=lambda x: x[0], reverse=True)
@@ -146,7 +146,8 @@ class ProductMatcher:
             policy, alternatives, client
         )
         
-        return ProductComparison(
+        # All inputs come from validated models - skip re-validation
+        return ProductComparison.model_construct(
             currentPolicy=current_policy_summary,
             alternatives=alternatives,
             comparisonNotes=comparison_notes
@@ -335,13 +335,14 @@ class AIAlertGenerator:
         surrender_end = policy.get("surrenderEndDate", "")
         
         # Parse surrender date to check if ending soon
-        from datetime import datetime as dt
-        try:
-            end_date = dt.fromisoformat(surrender_end.replace("Z", ""))
-            days_to_end = (end_date - dt.now()).days
-            surrender_ending_soon = days_to_end < 365  # Within 1 year
-        except:
-            surrender_ending_soon = False
+        surrender_ending_soon = False
+        if surrender_end:
+            try:
+                end_date = datetime.fromisoformat(surrender_end.replace("Z", ""))
+                days_to_end = (end_date - datetime.now()).days
+                surrender_ending_soon = days_to_end < 365  # Within 1 year
+            except (AttributeError, TypeError, ValueError):
+                pass  # Malformed date - treat as not ending soon
         
         # Check if better alternatives exist (simplified - check market average)
         market_cap_average = 5.5  # Typical market cap rate
@@ -387,11 +388,10 @@ class AIAlertGenerator:
         # - Life stage is pre-retirement but high risk products
         # - Policy age > 5 years (periodic review)
         
-        from datetime import datetime as dt
         try:
-            issue_date = dt.fromisoformat(policy.get("issueDate", "2020-01-01"))
-            policy_age = (dt.now() - issue_date).days / 365
-        except:
+            issue_date = datetime.fromisoformat(policy.get("issueDate", "2020-01-01"))
+            policy_age = (datetime.now() - issue_date).days / 365
+        except (TypeError, ValueError):
             policy_age = 0
         
         age_objective_mismatch = age >= 60 and current_objective == "Growth"
@@ -555,7 +555,7 @@ class AIAlertGenerator:
                     recency_score = 18
                 elif age_years > 1:
                     recency_score = 9
-            except:
+            except (AttributeError, TypeError, ValueError):
                 recency_score = 15  # Unknown age = moderate score
         else:
             recency_score = 20  # Never updated = high score
@@ -667,7 +667,7 @@ class AIAlertGenerator:
                 age_years = (datetime.now(last_updated.tzinfo) - last_updated).days / 365.25
                 if age_years > 3:
                     return True
-            except:
+            except (AttributeError, TypeError, ValueError):
                 pass
         
         return False
@@ -2,18 +2,69 @@
 In-Force Annuity Review Platform - FastAPI Backend
 Hackathon PoC - February 2026
 """
-from fastapi import FastAPI
+import logging
+import uuid
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from app.api import policies, clients, products, ai, replacement_transactions
 from app.config import settings
+from app.services.data_store import data_store
+
+# uvicorn only configures its own loggers - give the app.* loggers a console handler
+_app_log_handler = logging.StreamHandler()
+_app_log_handler.setFormatter(logging.Formatter("%(levelname)s:     %(name)s - %(message)s"))
+_app_logger = logging.getLogger("app")
+_app_logger.addHandler(_app_log_handler)
+_app_logger.setLevel(settings.LOG_LEVEL.upper())
+_app_logger.propagate = False
 
 app = FastAPI(
     title="Annuity Review API",
     description="In-Force Annuity Review Platform with AI Copilot - Hackathon PoC",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
-# CORS configuration for frontend
+# Listing endpoints whose payload only changes when the data store version does
+ETAG_PATHS = {"/api/policies", "/api/clients", "/api/acquisition-alerts"}
+
+# Distinguishes data versions across restarts and between workers
+_ETAG_PREFIX = uuid.uuid4().hex[:8]
+
+
+class ETagMiddleware:
+    """
+    Answer repeat polls of listing endpoints with 304 Not Modified.
+    Pure ASGI so every other request (including streaming responses) passes straight through.
+    """
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] != "GET" or scope["path"] not in ETAG_PATHS:
+            await self.app(scope, receive, send)
+            return
+        
+        etag = f'"{_ETAG_PREFIX}-v{data_store.version}"'
+        if Headers(scope=scope).get("if-none-match") == etag:
+            await Response(status_code=304, headers={"ETag": etag})(scope, receive, send)
+            return
+        
+        async def send_with_etag(message: Message):
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                MutableHeaders(scope=message)["ETag"] = etag
+            await send(message)
+        
+        await self.app(scope, receive, send_with_etag)
+
+
+app.add_middleware(ETagMiddleware)
+
+# CORS is added last so it wraps every response, including 304s
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.ALLOWED_ORIGINS,